@@ -5,9 +5,10 @@ This package provides PersonaAgent, an extension of AG2's ConversableAgent that
 enables agents to embody distinct personas through role, goal, and backstory components.
 """
 
+from ._eventloop import run_with_fast_loop
 from .async_persona_builder import AsyncPersonaBuilder
 from .persona_agent import PersonaAgent
 from .persona_builder import PersonaBuilder
 
 __version__ = "0.1.3"
-__all__ = ["AsyncPersonaBuilder", "PersonaAgent", "PersonaBuilder"]
+__all__ = ["AsyncPersonaBuilder", "PersonaAgent", "PersonaBuilder", "run_with_fast_loop"]
@@ -0,0 +1,40 @@
+"""
+Event loop helpers for running AsyncPersonaBuilder workloads.
+
+uvloop is an optional dependency (pip install ag2-persona[uvloop]). When it is
+installed, bulk persona loading runs on its libuv-based event loop, which has
+lower per-callback scheduling overhead than the default asyncio loop.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run_with_fast_loop(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, using uvloop when it is available.
+
+    Drop-in replacement for asyncio.run() at program entry points. Falls back to
+    asyncio.run() when uvloop is not installed.
+
+    Args:
+        main: Coroutine to run, e.g. one that awaits AsyncPersonaBuilder.build()
+
+    Returns:
+        The coroutine's result
+
+    Example:
+        >>> async def main():
+        ...     return await AsyncPersonaBuilder("analyst").from_markdown("analyst.md").build()
+        >>> agent = run_with_fast_loop(main())
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    result: T = uvloop.run(main)
+    return result
@@ -4,36 +4,73 @@ AsyncPersonaBuilder for creating PersonaAgent instances with fluent async-safe c
 This module provides AsyncPersonaBuilder using a deferred execution pattern that enables
 true single-chain syntax: await (builder.method1().method2().build()).
 
-Design Decision: Methods record operations in a queue and execute them during build().
-This enables perfect fluent chaining while supporting both sync and async operations.
-Only build() is async, allowing natural single-await syntax.
+Design Decision: Setters apply immediately; only file I/O is recorded in a queue and
+executed during build(). Setters chained after a pending load are queued behind it so
+operations still take effect in call order. Only build() is async, allowing natural
+single-await syntax.
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Self, cast
+from typing import Any, Self, cast
 
-if TYPE_CHECKING:
-    from .persona_agent import PersonaAgent
+from .parsers import PersonaMarkdownParser
+from .persona_agent import PersonaAgent
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_LOGGER = logging.getLogger(f"{__name__}.AsyncPersonaBuilder")
+
+# Operation recorded for execution during build(): a queued setter or an async file load
+_DeferredStep = Callable[[], object] | Callable[[], Awaitable[None]]
+
+# An llm_config dict must contain at least one of these keys
+_LLM_CONFIG_KEYS = frozenset(("config_list", "model"))
+
+_HUMAN_INPUT_MODES = ("NEVER", "ALWAYS", "TERMINATE")
+_VALID_HUMAN_INPUT_MODES = frozenset(_HUMAN_INPUT_MODES)
+
+
+def _read_persona_json(file_path: Path) -> Any:
+    """Read and decode a persona JSON file; run via asyncio.to_thread()."""
+    try:
+        content = file_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Persona JSON file not found: {file_path}") from None
+
+    try:
+        return _json_loads(content)
+    except ValueError as e:
+        raise ValueError(f"Error parsing persona JSON file {file_path}: {e}") from e
 
 
 class AsyncPersonaBuilder:
     """
     Fluent async-safe builder for creating PersonaAgent instances.
 
-    Uses deferred execution pattern where all methods record operations in a queue
-    and execute them during build(). This enables true single-chain syntax with
-    perfect operation ordering and type safety.
+    Uses deferred execution pattern where file loads are recorded in a queue and
+    executed during build(). Plain setters mutate builder state directly unless a
+    load is already queued, in which case they are queued behind it. This enables
+    true single-chain syntax with perfect operation ordering and type safety.
 
     Design Pattern:
         - All methods return Self for perfect fluent chaining
-        - Operations are queued and executed during build() in exact call order
-        - Mix of sync (property setters) and async (file I/O) operations supported
+        - Setters apply immediately; file I/O is queued and executed during build()
+        - Setters called after a queued load run after it, in exact call order
         - Single await required only at build() - no intermediate awaits needed
-        - Errors deferred until build() for clean validation and stack traces
+        - Errors from file loads are deferred until build()
 
     Examples:
         Basic usage with fluent chaining:
@@ -67,11 +104,16 @@ class AsyncPersonaBuilder:
         ...                .goal("Test Goal")
         ...                .llm_config({"model": "gpt-4"})
         ...                .build())
-        # Will log: "AsyncPersonaBuilder Running sync step: set_role" etc.
+        # Will log queued steps, e.g. "AsyncPersonaBuilder Running step: load_from_markdown"
+
+    Event Loop:
+        Programs that load many personas can run their entry point with
+        run_with_fast_loop() instead of asyncio.run() to use uvloop when it is
+        installed (pip install ag2-persona[uvloop]).
 
     Queue Execution Order:
         Operations execute in exact method call order during build():
-        1. All queued operations (sync first, then async)
+        1. All queued operations (file loads and any setters chained after them)
         2. Configuration validation
         3. PersonaAgent construction
         4. Return fully configured agent
@@ -83,6 +125,22 @@ class AsyncPersonaBuilder:
         - Build() returns PersonaAgent with all attributes guaranteed set
     """
 
+    __slots__ = (
+        "_backstory",
+        "_constraint_set",
+        "_constraints",
+        "_debug",
+        "_description",
+        "_goal",
+        "_llm_config",
+        "_metadata",
+        "_role",
+        "_steps",
+        "_version",
+        "additional_kwargs",
+        "name",
+    )
+
     def __init__(self, name: str, debug: bool = False):
         """
         Initialize AsyncPersonaBuilder with agent name.
@@ -93,111 +151,111 @@ class AsyncPersonaBuilder:
         """
         self.name = name
         self._debug = debug
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        # Queue of (is_async, function) tuples for deferred execution
-        self._steps: list[tuple[int, Callable[[], None] | Callable[[], Awaitable[None]]]] = []
+        # Queue of operations for deferred execution; created lazily
+        # when a file load is queued, so all-setter chains never allocate it
+        self._steps: list[_DeferredStep] | None = None
 
-        # Instance state - set during build()
+        # Persona state - set by setters, or by queued loads during build()
         self._role: str | None = None
         self._goal: str | None = None
         self._backstory: str = ""
         self._constraints: list[str] = []
+        # Mirrors _constraints for O(1) duplicate checks in add_constraint()
+        self._constraint_set: set[str] = set()
         self._llm_config: dict[str, Any] | bool | None = None
         self._description: str | None = None
         self._version: str | None = None
         self._metadata: dict[str, Any] = {}
         self.additional_kwargs: dict[str, Any] = {}
 
-    def _record_sync(self, func: Callable[[], None]) -> None:
-        """Record a synchronous operation for deferred execution."""
-        self._steps.append((0, func))
+    def _record(self, func: _DeferredStep) -> None:
+        """Record a sync or async operation for deferred execution."""
+        if self._steps is None:
+            self._steps = []
+        self._steps.append(func)
 
-    def _record_async(self, func: Callable[[], Awaitable[None]]) -> None:
-        """Record an asynchronous operation for deferred execution."""
-        self._steps.append((1, func))
-
-    def _log(self, label: str, func: Callable[[], None] | Callable[[], Awaitable[None]]) -> None:
+    def _log(self, label: str, func: _DeferredStep) -> None:
         """Log debug information if debug mode is enabled."""
         if self._debug:
-            fname = getattr(func, "__name__", repr(func))
-            self._logger.debug("AsyncPersonaBuilder %s: %s", label, fname)
+            fname = getattr(getattr(func, "func", func), "__name__", repr(func))
+            _LOGGER.debug("AsyncPersonaBuilder %s: %s", label, fname)
+
+    def _defer(self, method: Callable[..., Self], *args: Any, **kwargs: Any) -> Self:
+        """Queue a setter behind a pending async load so call order is preserved."""
+        self._record(partial(method, *args, **kwargs))
+        return self
 
     # ---- Sync builder methods ----
 
     def role(self, role: str) -> Self:
         """Set the persona's role or title."""
-
-        def set_role() -> None:
-            self._role = role
-
-        self._record_sync(set_role)
+        if self._steps:
+            return self._defer(self.role, role)
+        self._role = role
         return self
 
     def goal(self, goal: str) -> Self:
         """Set the persona's objective or goal."""
-
-        def set_goal() -> None:
-            self._goal = goal
-
-        self._record_sync(set_goal)
+        if self._steps:
+            return self._defer(self.goal, goal)
+        self._goal = goal
         return self
 
     def backstory(self, backstory: str) -> Self:
         """Set the persona's background and expertise."""
-
-        def set_backstory() -> None:
-            self._backstory = backstory
-
-        self._record_sync(set_backstory)
+        if self._steps:
+            return self._defer(self.backstory, backstory)
+        self._backstory = backstory
         return self
 
     def add_constraint(self, constraint: str) -> Self:
         """Add a single constraint or rule for the agent."""
-
-        def add_constraint_impl() -> None:
-            if constraint and constraint not in self._constraints:
-                self._constraints.append(constraint)
-
-        self._record_sync(add_constraint_impl)
+        if self._steps:
+            return self._defer(self.add_constraint, constraint)
+        if constraint and constraint not in self._constraint_set:
+            self._constraints.append(constraint)
+            self._constraint_set.add(constraint)
         return self
 
     def constraints(self, constraints: list[str]) -> Self:
         """Set multiple constraints at once, replacing any existing constraints."""
-
-        def set_constraints() -> None:
-            self._constraints = constraints
-
-        self._record_sync(set_constraints)
+        if self._steps:
+            return self._defer(self.constraints, constraints)
+        self._constraints = constraints
+        self._constraint_set = set(constraints)
         return self
 
     def llm_config(self, config: dict[str, Any] | bool) -> Self:
         """Set the LLM configuration for the agent."""
-
-        def set_llm_config() -> None:
-            self._llm_config = config
-
-        self._record_sync(set_llm_config)
+        if self._steps:
+            return self._defer(self.llm_config, config)
+        self._llm_config = config
         return self
 
     def temperature(self, temp: float) -> Self:
-        """Convenience method to set just the temperature in LLM config."""
-
-        def set_temperature() -> None:
-            if not self._llm_config:
-                self._llm_config = {}
-            if isinstance(self._llm_config, dict):
-                self._llm_config["temperature"] = temp
+        """Convenience method to set just the temperature in LLM config.
 
-        self._record_sync(set_temperature)
+        Raises:
+            ValueError: If the LLM config was set to a non-dictionary value
+        """
+        if self._steps:
+            return self._defer(self.temperature, temp)
+        llm_config = self._llm_config
+        if not llm_config:
+            self._llm_config = {"temperature": temp}
+        elif isinstance(llm_config, dict):
+            llm_config["temperature"] = temp
+        else:
+            raise ValueError(
+                f"LLM config must be a dictionary to set temperature for persona '{self.name}', got {type(llm_config)}"
+            )
         return self
 
     def description(self, description: str) -> Self:
         """Set description for GroupChat agent selection."""
-
-        def set_description() -> None:
-            self._description = description
-
-        self._record_sync(set_description)
+        if self._steps:
+            return self._defer(self.description, description)
+        self._description = description
         return self
 
     def human_input_mode(self, mode: str) -> Self:
@@ -209,66 +267,48 @@ class AsyncPersonaBuilder:
         Raises:
             ValueError: If mode is not valid
         """
-
-        def set_human_input_mode() -> None:
-            valid_modes = ["NEVER", "ALWAYS", "TERMINATE"]
-            if mode not in valid_modes:
-                raise ValueError(f"Invalid human_input_mode: {mode}. Must be one of {valid_modes}")
-            self.additional_kwargs["human_input_mode"] = mode
-
-        self._record_sync(set_human_input_mode)
+        if self._steps:
+            return self._defer(self.human_input_mode, mode)
+        if mode not in _VALID_HUMAN_INPUT_MODES:
+            raise ValueError(
+                f"Invalid human_input_mode: {mode}. Must be one of {list(_HUMAN_INPUT_MODES)}"
+            )
+        self.additional_kwargs["human_input_mode"] = mode
         return self
 
     def human_input_never(self) -> Self:
         """Set agent to never prompt for human input."""
-
-        def set_human_input_never() -> None:
-            self.additional_kwargs["human_input_mode"] = "NEVER"
-
-        self._record_sync(set_human_input_never)
-        return self
+        return self.human_input_mode("NEVER")
 
     def human_input_always(self) -> Self:
         """Set agent to always prompt for human input."""
-
-        def set_human_input_always() -> None:
-            self.additional_kwargs["human_input_mode"] = "ALWAYS"
-
-        self._record_sync(set_human_input_always)
-        return self
+        return self.human_input_mode("ALWAYS")
 
     def human_input_terminate(self) -> Self:
         """Set agent to prompt for human input only on termination (AG2 default)."""
-
-        def set_human_input_terminate() -> None:
-            self.additional_kwargs["human_input_mode"] = "TERMINATE"
-
-        self._record_sync(set_human_input_terminate)
-        return self
+        return self.human_input_mode("TERMINATE")
 
     def add_kwargs(self, **kwargs: Any) -> Self:
         """Add additional ConversableAgent parameters."""
-
-        def set_kwargs() -> None:
+        if self._steps:
+            return self._defer(self.add_kwargs, **kwargs)
+        if self.additional_kwargs:
             self.additional_kwargs.update(kwargs)
-
-        self._record_sync(set_kwargs)
+        else:
+            # **kwargs is already a fresh dict owned by this call
+            self.additional_kwargs = kwargs
         return self
 
     def extend_goal(self, additional_goal: str) -> Self:
         """Extend the existing goal with additional requirements."""
-
-        def extend_goal_impl() -> None:
-            if self._goal:
-                self._goal = f"{self._goal}. Additionally, {additional_goal}"
-            else:
-                self._goal = additional_goal
-
-        self._record_sync(extend_goal_impl)
+        if self._steps:
+            return self._defer(self.extend_goal, additional_goal)
+        if self._goal:
+            self._goal = f"{self._goal}. Additionally, {additional_goal}"
+        else:
+            self._goal = additional_goal
         return self
 
-    # ---- Async builder methods ----
-
     def from_dict(self, config_dict: dict[str, Any]) -> Self:
         """
         Load persona attributes from a configuration dictionary.
@@ -277,26 +317,29 @@ class AsyncPersonaBuilder:
         should be provided at runtime using llm_config().
         """
 
-        def load_from_dict() -> None:
-            if not isinstance(config_dict, dict):
-                raise ValueError(f"Configuration must be a dictionary for persona '{self.name}'")
-
-            # Load persona attributes (but not llm_config)
-            self._role = config_dict.get("role")
-            self._goal = config_dict.get("goal")
-            self._backstory = config_dict.get("backstory", "")
-
-            # Load constraints with type validation
-            constraints_raw = config_dict.get("constraints", [])
-            if constraints_raw and not isinstance(constraints_raw, list):
-                raise ValueError(
-                    f"Constraints must be a list for persona '{self.name}', got {type(constraints_raw)}"
-                )
-            self._constraints = constraints_raw
-
-        self._record_sync(load_from_dict)
+        if self._steps:
+            return self._defer(self.from_dict, config_dict)
+        if not isinstance(config_dict, dict):
+            raise ValueError(f"Configuration must be a dictionary for persona '{self.name}'")
+
+        # Load persona attributes (but not llm_config)
+        self._role = config_dict.get("role")
+        self._goal = config_dict.get("goal")
+        self._backstory = config_dict.get("backstory", "")
+
+        # Load constraints with type validation
+        constraints_raw = config_dict.get("constraints", [])
+        if constraints_raw and not isinstance(constraints_raw, list):
+            raise ValueError(
+                f"Constraints must be a list for persona '{self.name}', got {type(constraints_raw)}"
+            )
+        # "constraints: null" means no constraints, as in PersonaBuilder
+        self._constraints = constraints_raw or []
+        self._constraint_set = set(self._constraints)
         return self
 
+    # ---- Async builder methods ----
+
     def from_markdown(self, file_path: str | Path) -> Self:
         """
         Load persona definition from a Markdown file asynchronously.
@@ -313,7 +356,7 @@ class AsyncPersonaBuilder:
         Raises:
             FileNotFoundError: If the Markdown file doesn't exist (raised during build())
             ValueError: If the Markdown format is invalid (raised during build())
-            ImportError: If required dependencies (python-frontmatter, ruamel.yaml, aiofiles) are not installed (raised during build())
+            ImportError: If required dependencies (python-frontmatter, PyYAML) are not installed (raised during build())
 
         Example:
             >>> # File I/O happens asynchronously during build(), not here
@@ -345,28 +388,12 @@ class AsyncPersonaBuilder:
         """
 
         async def load_from_markdown() -> None:
-            from .parsers import PersonaMarkdownParser
-
-            try:
-                import aiofiles
-                import aiofiles.os
-            except ImportError as err:
-                raise ImportError(
-                    "aiofiles is required for async markdown loading. Install with: pip install aiofiles"
-                ) from err
-
             file_path_obj = Path(file_path)
 
-            # Async file existence check
-            if not await aiofiles.os.path.exists(file_path_obj):
-                raise FileNotFoundError(f"Persona Markdown file not found: {file_path_obj}")
-
-            # Async file I/O
-            async with aiofiles.open(file_path_obj) as f:
-                content = await f.read()
-
-            # Parse content using simplified parser
-            config = PersonaMarkdownParser.parse_persona_markdown(content)
+            # Read and parse in a single worker-thread hop to keep the event loop unblocked
+            config = await asyncio.to_thread(
+                PersonaMarkdownParser.parse_persona_file, file_path_obj
+            )
 
             # Handle name resolution (business logic)
             config["name"] = self.name or config.get("name") or file_path_obj.stem
@@ -377,6 +404,7 @@ class AsyncPersonaBuilder:
             self._goal = config["goal"]
             self._backstory = config["backstory"]
             self._constraints = config["constraints"]
+            self._constraint_set = set(self._constraints)
             self._llm_config = config["llm_config"]
             self._description = config["description"]
             self._version = config.get("version")
@@ -385,13 +413,69 @@ class AsyncPersonaBuilder:
             if config.get("metadata"):
                 self._metadata.update(config["metadata"])
 
-        self._record_async(load_from_markdown)
+        self._record(load_from_markdown)
+        return self
+
+    def from_json(self, file_path: str | Path) -> Self:
+        """
+        Load persona attributes from a JSON file asynchronously.
+
+        The file holds the output of PersonaAgent.to_dict(): the from_dict() fields plus
+        version, metadata, llm_config and a name used when the builder has none. A later
+        llm_config() call in the chain still takes precedence. JSON avoids YAML parsing
+        entirely and is decoded with orjson when it is installed
+        (pip install ag2-persona[orjson]), falling back to the standard library json
+        module.
+
+        Args:
+            file_path: Path to JSON configuration file
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            FileNotFoundError: If the JSON file doesn't exist (raised during build())
+            ValueError: If the file is not valid persona JSON (raised during build())
+
+        Example:
+            >>> agent = await (AsyncPersonaBuilder("analyst")
+            ...                .from_json("configs/data_analyst.json")
+            ...                .llm_config({"model": "gpt-4"})
+            ...                .build())
+        """
+
+        async def load_from_json() -> None:
+            config = await asyncio.to_thread(_read_persona_json, Path(file_path))
+            self.from_dict(config)
+
+            # Unlike from_dict(), keep everything PersonaAgent.to_dict() exports
+            self._version = config.get("version")
+            if config.get("metadata"):
+                self._metadata.update(config["metadata"])
+            if not self.name and (name := config.get("name")) is not None:
+                self.name = name
+            if "llm_config" in config:
+                self._llm_config = config["llm_config"]
+
+        self._record(load_from_json)
         return self
 
     # ---- Finalizer ----
 
     def validate(self) -> None:
         """Validate the current configuration before building."""
+        llm_config = self._llm_config
+        # LLM config is optional (False means no LLM); a dict must name a model source
+        llm_config_ok = (
+            llm_config is None
+            or llm_config is False
+            or (isinstance(llm_config, dict) and not _LLM_CONFIG_KEYS.isdisjoint(llm_config))
+        )
+
+        # Fast path: nothing to report, so skip building error messages
+        if self.name and self._role and self._goal and llm_config_ok:
+            return
+
         errors = []
 
         if not self.name:
@@ -401,24 +485,20 @@ class AsyncPersonaBuilder:
         if not self._goal:
             errors.append(f"Goal is required for persona '{self.name}'")
 
-        # Validate LLM config structure if provided (skip if False - means no LLM)
-        if self._llm_config is not None and self._llm_config is not False:
-            if isinstance(self._llm_config, dict):
-                required_keys = ["config_list", "model"]
-                if not any(key in self._llm_config for key in required_keys):
-                    errors.append(
-                        f"LLM config must contain one of {required_keys} for persona '{self.name}'"
-                    )
+        if not llm_config_ok:
+            if isinstance(llm_config, dict):
+                errors.append(
+                    f"LLM config must contain one of ['config_list', 'model'] for persona '{self.name}'"
+                )
             else:
                 errors.append(
-                    f"LLM config must be a dictionary for persona '{self.name}', got {type(self._llm_config)}"
+                    f"LLM config must be a dictionary for persona '{self.name}', got {type(llm_config)}"
                 )
 
-        if errors:
-            error_msg = f"Persona validation failed for '{self.name}':\n" + "\n".join(
-                f"  - {error}" for error in errors
-            )
-            raise ValueError(error_msg)
+        error_msg = f"Persona validation failed for '{self.name}':\n" + "\n".join(
+            f"  - {error}" for error in errors
+        )
+        raise ValueError(error_msg)
 
     async def build(self) -> PersonaAgent:
         """
@@ -430,25 +510,26 @@ class AsyncPersonaBuilder:
         Raises:
             ValueError: If validation fails
         """
-        # Execute all deferred operations in order
-        for is_async, func in self._steps:
-            if is_async:
-                self._log("Awaiting async step", func)
-                await cast(Callable[[], Awaitable[None]], func)()
-            else:
-                self._log("Running sync step", func)
-                func()
+        # Execute deferred operations in call order. The queue is detached first so that
+        # queued setters apply directly when replayed.
+        steps, self._steps = self._steps or [], None
+        completed = 0
+        try:
+            for func in steps:
+                self._log("Running step", func)
+                result = func()
+                # File loads are coroutine functions; queued setters return the builder
+                if inspect.isawaitable(result):
+                    await result
+                completed += 1
+        except BaseException:
+            # Requeue the failed step and everything after it so build() can be retried
+            self._steps = steps[completed:]
+            raise
 
         # Validate the final configuration
         self.validate()
 
-        # Import here to avoid circular imports
-        from .persona_agent import PersonaAgent
-
-        # After validation, these should be guaranteed to exist
-        assert self._role is not None, "Role should be set after validation"
-        assert self._goal is not None, "Goal should be set after validation"
-
         # Add version and metadata to kwargs if set
         kwargs = self.additional_kwargs.copy()
         if self._version is not None:
@@ -458,8 +539,8 @@ class AsyncPersonaBuilder:
 
         return PersonaAgent(
             name=self.name,
-            role=self._role,
-            goal=self._goal,
+            role=cast(str, self._role),  # Guaranteed by validate()
+            goal=cast(str, self._goal),
             backstory=self._backstory,
             constraints=self._constraints,
             description=self._description,
@@ -467,7 +548,32 @@ class AsyncPersonaBuilder:
             **kwargs,
         )
 
+    @classmethod
+    async def build_many(cls, builders: Iterable[AsyncPersonaBuilder]) -> list[PersonaAgent]:
+        """
+        Build several PersonaAgent instances concurrently.
+
+        File loads queued on each builder run in worker threads, so gathering the
+        builds overlaps their I/O instead of awaiting each file in turn.
+
+        Args:
+            builders: Configured builders to build
+
+        Returns:
+            list[PersonaAgent]: Built agents, in the same order as builders
+
+        Raises:
+            ValueError: If validation fails for any builder
+
+        Example:
+            >>> agents = await AsyncPersonaBuilder.build_many(
+            ...     AsyncPersonaBuilder(path.stem).from_markdown(path).llm_config(False)
+            ...     for path in Path("personas").glob("*.md")
+            ... )
+        """
+        return list(await asyncio.gather(*(builder.build() for builder in builders)))
+
     def __repr__(self) -> str:
         """String representation of the builder."""
-        steps_count = len(self._steps)
+        steps_count = len(self._steps or ())
         return f"AsyncPersonaBuilder(name='{self.name}', queued_steps={steps_count})"
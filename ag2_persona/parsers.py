@@ -5,50 +5,375 @@ This module provides shared parsing logic to avoid code duplication between
 sync and async PersonaBuilder implementations.
 """
 
+import copy
+import json
 import logging
 import re
-from datetime import date
-from typing import Any
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar
+
+try:
+    import frontmatter
+    import yaml
+
+    _MARKDOWN_IMPORT_ERROR: ImportError | None = None
+except ImportError as err:
+    # Reported on first Markdown parse so the rest of the package stays importable
+    _MARKDOWN_IMPORT_ERROR = err
+
+
+# A frontmatter delimiter-like line: three or more dashes and optional trailing space
+_DELIMITER_LINE = re.compile(r"^-{3,}[ \t]*$", re.MULTILINE)
+
+# (time.monotonic() expiry, "YYYY-MM-DD") for the default persona version
+_today_cache: tuple[float, str] = (0.0, "")
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, recomputed at most once a minute and at midnight."""
+    global _today_cache  # noqa: PLW0603
+    expires, today = _today_cache
+    now = time.monotonic()
+    if now >= expires:
+        current = datetime.now()
+        seconds_to_midnight = 86400 - (
+            current.hour * 3600 + current.minute * 60 + current.second + current.microsecond / 1e6
+        )
+        today = f"{current.year:04d}-{current.month:02d}-{current.day:02d}"
+        _today_cache = (now + min(60.0, seconds_to_midnight), today)
+    return today
+
+
+@lru_cache(maxsize=1)
+def _frontmatter_handler() -> Any:
+    """Create the shared frontmatter handler once; it holds no per-parse state."""
+    # Prefer the libyaml C implementation when PyYAML was built with it
+    safe_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class PersonaLoader(safe_loader):  # type: ignore[misc,valid-type]
+        """Safe loader that resolves plain scalars the way YAML 1.2 (ruamel.yaml) does."""
+
+    # PyYAML follows YAML 1.1, where yes/no/on/off are booleans, 1:30 is a base-60
+    # number, 0777 is octal and 1e3 is a string; persona files were written against
+    # YAML 1.2, so `goal: No` must stay a string and `max_tokens: 1e3` a float.
+    # add_implicit_resolver() appends to lists shared with the parent class, so the
+    # resolver table is copied before it is modified.
+    replaced = {"tag:yaml.org,2002:bool", "tag:yaml.org,2002:int", "tag:yaml.org,2002:float"}
+    PersonaLoader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag not in replaced]
+        for first, resolvers in safe_loader.yaml_implicit_resolvers.items()
+    }
+    PersonaLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:bool",
+        re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+        list("tTfF"),
+    )
+    PersonaLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:int",
+        re.compile(
+            r"""^(?:[-+]?0b[0-1_]+
+                |[-+]?0o?[0-7_]+
+                |[-+]?[0-9_]+
+                |[-+]?0x[0-9a-fA-F_]+)$""",
+            re.VERBOSE,
+        ),
+        list("-+0123456789"),
+    )
+    PersonaLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:float",
+        re.compile(
+            r"""^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+                |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+                |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+                |[-+]?\.(?:inf|Inf|INF)
+                |\.(?:nan|NaN|NAN))$""",
+            re.VERBOSE,
+        ),
+        list("-+0123456789."),
+    )
+
+    def construct_int(loader: Any, node: Any) -> int:
+        # YAML 1.2 octals are written 0o17; a plain leading zero (0777) is decimal
+        value = loader.construct_scalar(node).replace("_", "")
+        sign = -1 if value[0] == "-" else 1
+        digits = value.lstrip("+-")
+        base = {"0b": 2, "0o": 8, "0x": 16}.get(digits[:2])
+        return sign * (int(digits[2:], base) if base else int(digits))
+
+    PersonaLoader.add_constructor("tag:yaml.org,2002:int", construct_int)
+
+    class LibYAMLHandler(frontmatter.YAMLHandler):  # type: ignore[misc]
+        def load(self, fm: str) -> Any:
+            return yaml.load(fm, Loader=PersonaLoader)
+
+    return LibYAMLHandler()
+
+
+@lru_cache(maxsize=256)
+def _parse_content_cached(content: str) -> dict[str, Any]:
+    """Parse persona Markdown content; identical content strings share one parse."""
+    return PersonaMarkdownParser._parse_content(content)
+
+
+@lru_cache(maxsize=128)
+def _parse_persona_file_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a persona file; mtime_ns and size key the cache so edits trigger a re-parse."""
+    file_path = Path(path)
+    indexed = _indexed_config(file_path, mtime_ns, size)
+    if indexed is not None:
+        return indexed
+
+    return PersonaMarkdownParser._parse_content(_read_markdown(file_path))
+
+
+def _read_markdown(file_path: Path) -> str:
+    """Read a Markdown file as UTF-8 with newlines normalized, like read_text()."""
+    # read_bytes() skips the TextIOWrapper that read_text() builds for a one-shot read
+    content = file_path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+# Sibling file written by PersonaMarkdownParser.build_index()
+INDEX_FILENAME = "personas.index.json"
+
+
+@lru_cache(maxsize=32)
+def _load_index(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Load a persona index file; unreadable or malformed indexes are treated as empty."""
+    try:
+        index = json.loads(Path(path).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _indexed_config(file_path: Path, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Return the prebuilt config for file_path if its directory index is current for it."""
+    index_path = file_path.parent / INDEX_FILENAME
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return None
+
+    entry = _load_index(str(index_path), stat.st_mtime_ns, stat.st_size).get(file_path.name)
+    if isinstance(entry, dict) and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+        config = entry.get("config")
+        if isinstance(config, dict):
+            return config
+    return None
+
+
+# Absolute path -> (time.monotonic() of the last stat, st_mtime_ns, st_size)
+_recent_stats: dict[str, tuple[float, int, int]] = {}
+_RECENT_STATS_MAX = 1024
 
 
 class PersonaMarkdownParser:
     """Shared Markdown parsing utility for both sync and async PersonaBuilder."""
 
+    # Seconds a file's last stat() result is trusted before checking it for edits
+    # again. 0 checks on every load; long-running services that load the same
+    # personas constantly can raise it to skip the stat() and pick up edits late.
+    REVALIDATE_INTERVAL: ClassVar[float] = 0.0
+
+    @staticmethod
+    def parse_persona_file(file_path: Path) -> dict[str, Any]:
+        """
+        Read and parse a persona Markdown file, reusing earlier parses of unchanged files.
+
+        Parsed configurations are cached by (path, modification time, size), so loading
+        the same unmodified file again costs a single stat() call, or none while the
+        previous stat() is younger than REVALIDATE_INTERVAL seconds.
+
+        Args:
+            file_path: Path to the Markdown file to parse
+
+        Returns:
+            dict: Persona configuration (a fresh copy the caller may modify)
+
+        Raises:
+            FileNotFoundError: If the Markdown file doesn't exist
+            ValueError: If the Markdown format is invalid
+            ImportError: If required dependencies are not installed
+        """
+        # EAFP: the stat doubles as the existence check, and a file removed between
+        # the stat and the read reports the same error
+        try:
+            path = str(file_path.absolute())
+            interval = PersonaMarkdownParser.REVALIDATE_INTERVAL
+            now = time.monotonic() if interval > 0 else 0.0
+            recent = _recent_stats.get(path) if interval > 0 else None
+            if recent is not None and now - recent[0] < interval:
+                _, mtime_ns, size = recent
+            else:
+                stat = file_path.stat()
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+                if interval > 0:
+                    if len(_recent_stats) >= _RECENT_STATS_MAX:
+                        _recent_stats.clear()
+                    _recent_stats[path] = (now, mtime_ns, size)
+            cached = _parse_persona_file_cached(path, mtime_ns, size)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Persona Markdown file not found: {file_path}") from None
+
+        config = copy.deepcopy(cached)
+        PersonaMarkdownParser._handle_version(config)
+        return config
+
+    @staticmethod
+    def build_index(directory: Path) -> Path:
+        """
+        Pre-parse every persona Markdown file in a directory into a JSON index.
+
+        The index is written next to the files as personas.index.json. Later loads
+        of an indexed file whose modification time and size still match skip reading
+        and parsing it; edited or new files are parsed as usual. Files that fail to
+        parse, or whose configuration does not load back from JSON unchanged, are left
+        out.
+
+        Args:
+            directory: Directory containing persona Markdown files
+
+        Returns:
+            Path: Path of the written index file
+        """
+        entries: dict[str, Any] = {}
+        for file_path in sorted(directory.glob("*.md")):
+            try:
+                stat = file_path.stat()
+                config = PersonaMarkdownParser._parse_content(_read_markdown(file_path))
+                round_tripped = json.loads(json.dumps(config))
+            except (OSError, TypeError, ValueError) as e:
+                logging.warning(f"Not indexing persona file {file_path}: {e}")
+                continue
+            if round_tripped != config:
+                # e.g. non-string metadata keys, which JSON turns into strings
+                logging.warning(
+                    f"Not indexing persona file {file_path}: configuration does not survive JSON"
+                )
+                continue
+            entries[file_path.name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "config": config,
+            }
+
+        index_path = directory / INDEX_FILENAME
+        index_path.write_text(json.dumps(entries), encoding="utf-8")
+        return index_path
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached persona parses."""
+        _parse_persona_file_cached.cache_clear()
+        _parse_content_cached.cache_clear()
+        _load_index.cache_clear()
+        _recent_stats.clear()
+
     @staticmethod
     def parse_persona_markdown(content: str) -> dict[str, Any]:
         """
         Parse Markdown content into persona configuration.
 
+        Parses of identical content are cached, so the same persona text is only
+        parsed once per process.
+
         Args:
             content: Markdown content string to parse
 
         Returns:
             dict: Persona configuration with standard fields populated from
-                  frontmatter and markdown sections
+                  frontmatter and markdown sections (a fresh copy the caller may modify)
 
         Raises:
             ValueError: If the Markdown format is invalid
             ImportError: If required dependencies are not installed
         """
+        config = copy.deepcopy(_parse_content_cached(content))
+        PersonaMarkdownParser._handle_version(config)
+        return config
+
+    @staticmethod
+    def read_frontmatter(file_path: Path) -> dict[str, Any]:
+        """
+        Read only the YAML frontmatter of a persona Markdown file.
+
+        The file is read line by line up to the closing "---" delimiter, so the
+        Markdown body is never loaded. Suited to listing or indexing many personas
+        without paying for their backstories. No required-field validation is done.
+
+        Args:
+            file_path: Path to the Markdown file
+
+        Returns:
+            dict: Frontmatter metadata, or an empty dict if the file has none
+
+        Raises:
+            FileNotFoundError: If the Markdown file doesn't exist
+            ValueError: If the frontmatter is invalid
+            ImportError: If required dependencies are not installed
+        """
+        PersonaMarkdownParser._require_dependencies()
+
+        try:
+            with file_path.open(encoding="utf-8") as f:
+                line = f.readline()
+                while line and not line.strip():
+                    line = f.readline()
+
+                if line.rstrip("\r\n") == "---":
+                    lines: list[str] = []
+                    for line in f:
+                        delimiter = line.rstrip("\r\n")
+                        if delimiter == "---":
+                            return PersonaMarkdownParser._load_frontmatter("".join(lines))
+                        if _DELIMITER_LINE.match(delimiter):
+                            # e.g. "--- "; leave it to the full splitter
+                            break
+                        lines.append(line)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Persona Markdown file not found: {file_path}") from None
+
+        # No "---" delimited block: defer to the full splitter's handling
+        content = _read_markdown(file_path)
+        try:
+            metadata, _ = PersonaMarkdownParser._split_frontmatter(content)
+        except Exception as e:
+            raise ValueError(f"Error parsing frontmatter: {e}") from e
+        return metadata
+
+    @staticmethod
+    def _load_frontmatter(text: str) -> dict[str, Any]:
+        """Load a YAML frontmatter block, treating non-mapping documents as empty."""
         try:
-            import frontmatter
-            from ruamel.yaml import YAML
-        except ImportError as err:
-            missing_lib = "python-frontmatter" if "frontmatter" in str(err) else "ruamel.yaml"
+            fm_data = _frontmatter_handler().load(text)
+        except Exception as e:
+            raise ValueError(f"Error parsing frontmatter: {e}") from e
+        return fm_data if isinstance(fm_data, dict) else {}
+
+    @staticmethod
+    def _require_dependencies() -> None:
+        """Raise a helpful ImportError if python-frontmatter or PyYAML is missing."""
+        if _MARKDOWN_IMPORT_ERROR is not None:
+            err = _MARKDOWN_IMPORT_ERROR
+            missing_lib = "python-frontmatter" if "frontmatter" in str(err) else "PyYAML"
             raise ImportError(
                 f"{missing_lib} is required for Markdown persona files. Install with: pip install {missing_lib}"
             ) from err
 
-        # Use python-frontmatter with ruamel.yaml as the engine
+    @staticmethod
+    def _parse_content(content: str) -> dict[str, Any]:
+        """Parse Markdown content into a persona configuration without a default version."""
+        PersonaMarkdownParser._require_dependencies()
+
+        # Use python-frontmatter with PyYAML's safe loader as the engine
         try:
-            # Create custom handler that uses ruamel.yaml
-            class RuamelYAMLHandler(frontmatter.YAMLHandler):  # type: ignore[misc]
-                def load(self, fm: str) -> Any:
-                    return YAML().load(fm)
-
-            post = frontmatter.loads(content, handler=RuamelYAMLHandler())
-            metadata = post.metadata
-            main_content = post.content
+            metadata, main_content = PersonaMarkdownParser._split_frontmatter(content)
         except Exception as e:
             raise ValueError(f"Error parsing frontmatter: {e}") from e
 
@@ -62,10 +387,10 @@ class PersonaMarkdownParser:
             "name": metadata.get("name"),  # None if not in frontmatter
             "role": metadata.get("role"),  # SPEC: frontmatter only
             "goal": metadata.get("goal"),  # SPEC: frontmatter only
-            "backstory": sections.get("backstory", "").strip(),  # CHARACTER: markdown only
+            "backstory": sections.get("backstory", ""),  # CHARACTER: markdown only
             "constraints": [],  # SPEC: frontmatter only (handled below)
             "llm_config": metadata.get("llm_config"),  # SPEC: frontmatter only
-            "description": sections.get("description", "").strip()
+            "description": sections.get("description")
             or metadata.get("description"),  # Can be in either
             "version": metadata.get("version"),  # SPEC: frontmatter only
             "metadata": metadata.get("metadata", {}),  # Extensible user-defined metadata
@@ -74,9 +399,6 @@ class PersonaMarkdownParser:
         # Handle constraints from sections or metadata
         PersonaMarkdownParser._apply_constraints(sections, metadata, config)
 
-        # Handle version - warn and default to today's date if missing
-        PersonaMarkdownParser._handle_version(config, metadata)
-
         # Note: Unknown frontmatter keys are ignored for security
         # All custom data should go in the 'metadata:' field
 
@@ -102,11 +424,11 @@ class PersonaMarkdownParser:
         # to maintain the Spec vs Character separation
 
     @staticmethod
-    def _handle_version(config: dict[str, Any], metadata: dict[str, Any]) -> None:
+    def _handle_version(config: dict[str, Any]) -> None:
         """Handle version field - warn and default to today's date if missing."""
         if not config.get("version"):
-            # Generate today's date in YYYY-MM-DD format
-            today = date.today().strftime("%Y-%m-%d")
+            # Today's date in YYYY-MM-DD format (shared across a batch of loads)
+            today = _today_str()
             config["version"] = today
 
             # Log warning about missing version
@@ -119,25 +441,73 @@ class PersonaMarkdownParser:
     @staticmethod
     def _validate_required_fields(config: dict[str, Any]) -> None:
         """Validate that all required fields are present for markdown personas."""
-        errors = []
+        # SPEC fields (must be in frontmatter); constraints can be missing
+        role = config.get("role")
+        goal = config.get("goal")
+        # CHARACTER fields (must be in markdown content)
+        # (section text is already stripped by _parse_markdown_sections)
+        has_backstory = bool(config.get("backstory"))
 
-        # SPEC fields (must be in frontmatter)
-        if not config.get("role"):
+        # Fast path: valid personas need no error bookkeeping
+        if role and goal and has_backstory:
+            return
+
+        errors = []
+        if not role:
             errors.append("'role' is required in frontmatter")
-        if not config.get("goal"):
+        if not goal:
             errors.append("'goal' is required in frontmatter")
-        # Note: constraints can be missing (defaults to empty list)
-
-        # CHARACTER fields (must be in markdown content)
-        if not config.get("backstory", "").strip():
+        if not has_backstory:
             errors.append("'# Backstory' section is required in markdown content")
 
-        if errors:
-            persona_name = config.get("name", "unknown")
-            error_msg = f"Required fields missing for persona '{persona_name}':\n" + "\n".join(
-                f"  - {error}" for error in errors
-            )
-            raise ValueError(error_msg)
+        persona_name = config.get("name", "unknown")
+        error_msg = f"Required fields missing for persona '{persona_name}':\n" + "\n".join(
+            f"  - {error}" for error in errors
+        )
+        raise ValueError(error_msg)
+
+    @staticmethod
+    def _split_frontmatter(content: str) -> tuple[dict[str, Any], str]:
+        """
+        Split Markdown content into frontmatter metadata and body.
+
+        The usual "---" delimited layout is split directly; anything else is left to
+        python-frontmatter so its handling of unusual delimiters still applies.
+        """
+        text = content.strip()
+        if text.startswith(("---\n", "---\r\n")):
+            if "\r" in text:
+                text = text.replace("\r\n", "\n")
+            end = text.find("\n---\n", 3)
+            if end == -1 and text.endswith("\n---"):
+                end = len(text) - 4
+            # A delimiter line that is not exactly "---" (e.g. "--- ") means the find()
+            # above may have stopped at a horizontal rule in the body instead
+            if end != -1 and not _DELIMITER_LINE.search(text, 4, end):
+                fm_data = _frontmatter_handler().load(text[4 : end + 1])
+                metadata = fm_data if isinstance(fm_data, dict) else {}
+                return metadata, text[end + 5 :].strip()
+
+        post = frontmatter.loads(content, handler=_frontmatter_handler())
+        return post.metadata, post.content
+
+    @staticmethod
+    def _header_title(line: str) -> str | None:
+        """
+        Return the title of a "# Title" or "## Title" header line, or None.
+
+        Equivalent to matching r"^#{1,2}\\s+(.+)$" against the stripped line, but
+        rejects ordinary text lines with a single character check.
+        """
+        stripped = line.lstrip()
+        if not stripped.startswith("#"):
+            return None
+
+        rest = stripped[2:] if stripped.startswith("##") else stripped[1:]
+        if not rest[:1].isspace():
+            return None
+
+        return rest.strip() or None
 
     @staticmethod
     def _parse_markdown_sections(content: str) -> dict[str, str]:
@@ -150,32 +520,29 @@ class PersonaMarkdownParser:
             content: Markdown content to parse
 
         Returns:
-            Dictionary mapping section names to their content
+            Dictionary mapping section names to their stripped content
         """
-        sections = {}
+        lines = content.splitlines()
+        sections: dict[str, str] = {}
         current_section = None
-        current_content: list[str] = []
-
-        # Compile regex once for better performance
-        header_pattern = re.compile(r"^#{1,2}\s+(.+)$")
+        section_start = 0
 
-        # Single pass through lines for better performance
-        for line in content.splitlines():
-            header_match = header_pattern.match(line.strip())
+        # Single pass; each section body is joined straight from a slice of lines
+        for index in range(len(lines)):
+            title = PersonaMarkdownParser._header_title(lines[index])
+            if title is None:
+                continue
 
-            if header_match:
-                # Save previous section if exists
-                if current_section and current_content:
-                    sections[current_section] = "\n".join(current_content).strip()
+            # Save previous section unless it has no body lines
+            if current_section and index > section_start:
+                sections[current_section] = "\n".join(lines[section_start:index]).strip()
 
-                # Start new section
-                current_section = header_match.group(1).lower().replace(" ", "_")
-                current_content = []
-            elif current_section:
-                current_content.append(line)
+            # Start new section
+            current_section = title.lower().replace(" ", "_")
+            section_start = index + 1
 
         # Save last section
-        if current_section and current_content:
-            sections[current_section] = "\n".join(current_content).strip()
+        if current_section and len(lines) > section_start:
+            sections[current_section] = "\n".join(lines[section_start:]).strip()
 
         return sections
@@ -5,7 +5,13 @@ This module provides PersonaAgent, an extension of ConversableAgent that
 enables agents to embody distinct personas through role, goal, and backstory components.
 """
 
-from typing import Any
+import copy
+import sys
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, ClassVar, Self
 
 try:
     from autogen import ConversableAgent
@@ -31,6 +37,11 @@ except ImportError:
     AG2_AVAILABLE = False
 
 
+def _intern(value: Any) -> Any:
+    """Intern exact str values so personas repeated across agents share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class PersonaAgent(ConversableAgent):
     """
     An AG2 agent that embodies a distinct persona.
@@ -59,6 +70,38 @@ class PersonaAgent(ConversableAgent):
         ... )
     """
 
+    # Persona state lives in slots; ConversableAgent keeps its own __dict__ for the
+    # attributes it manages (including description)
+    __slots__ = (
+        "_batch_depth",
+        "_constraints_block",
+        "_constraints_set",
+        "_human_input_mode",
+        "_message_pending",
+        "_metadata",
+        "_persona_name",
+        "_pool_kwargs",
+        "_prompt_frozen",
+        "_prompt_header",
+        "_rendered_message",
+        "_repr_cache",
+        "backstory",
+        "constraints",
+        "goal",
+        "role",
+        "version",
+    )
+
+    # Class-level default so the name setter can check it directly even before
+    # __init__ runs; kept out of __slots__ so instances can shadow it
+    _construction_complete: bool = False
+
+    # Released agents kept for reuse by acquire(), capped at POOL_MAX_SIZE
+    _pool: ClassVar[list["PersonaAgent"]] = []
+    # Guards _pool so concurrent acquire()/release() calls never share an agent
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    POOL_MAX_SIZE: ClassVar[int] = 100
+
     def __init__(
         self,
         name: str,
@@ -86,12 +129,15 @@ class PersonaAgent(ConversableAgent):
             **kwargs: Additional ConversableAgent parameters (llm_config, human_input_mode, etc.)
         """
         # Store structured components as properties
-        self.role = role
-        self.goal = goal
-        self.backstory = backstory
-        self.constraints = constraints if constraints is not None else []
-        self.version = version
-        self._metadata = metadata if metadata is not None else {}
+        self._set_persona(role, goal, backstory, constraints, version=version, metadata=metadata)
+        # kwargs an agent from acquire() was built with; None for directly built agents
+        self._pool_kwargs: dict[str, Any] | None = None
+
+        # batch_update() nesting depth, freeze_prompt() state, and whether a system
+        # message rebuild is waiting on either of them
+        self._batch_depth = 0
+        self._prompt_frozen = False
+        self._message_pending = False
 
         # Store name for immutability control (before parent init)
         self._persona_name = name
@@ -107,6 +153,8 @@ class PersonaAgent(ConversableAgent):
 
         # Build the structured system message
         system_message = self._build_system_message()
+        # Last rendered persona message; lets add_constraint() append in place
+        self._rendered_message = system_message
 
         # Handle any additional system_message in kwargs
         # This maintains backward compatibility
@@ -125,6 +173,161 @@ class PersonaAgent(ConversableAgent):
         # Mark construction as complete to enable name immutability
         self._construction_complete = True
 
+    @classmethod
+    def acquire(
+        cls,
+        name: str,
+        role: str,
+        goal: str,
+        *,
+        backstory: str = "",
+        constraints: list[str] | None = None,
+        description: str | None = None,
+        version: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Get a PersonaAgent from the pool of released agents, or construct a new one.
+
+        Takes the same arguments as PersonaAgent(). A pooled agent is reused only if
+        it was built with equal ConversableAgent kwargs (llm_config, human_input_mode,
+        etc.); its persona, name and system message are replaced, skipping AG2's
+        ConversableAgent initialization. Suited to short-lived agents created per
+        request, such as judges or selectors. Hand agents back with release() and do
+        not use them afterwards.
+
+        Example:
+            >>> judge = PersonaAgent.acquire("judge", role="Judge", goal="Pick the best answer")
+            >>> ...
+            >>> PersonaAgent.release(judge)
+        """
+        pooled: PersonaAgent | None = None
+        with cls._pool_lock:
+            pool = cls._pool
+            for index in range(len(pool) - 1, -1, -1):
+                agent = pool[index]
+                if type(agent) is cls and agent._pool_kwargs == kwargs:
+                    pooled = pool.pop(index)
+                    break
+
+        if pooled is not None:
+            pooled._reset(
+                name,
+                role,
+                goal,
+                backstory=backstory,
+                constraints=constraints,
+                description=description,
+                version=version,
+                metadata=metadata,
+            )
+            return pooled
+
+        new_agent = cls(
+            name,
+            role,
+            goal,
+            backstory=backstory,
+            constraints=constraints,
+            description=description,
+            version=version,
+            metadata=metadata,
+            **kwargs,
+        )
+        # Deep copy so later changes to the caller's dicts (e.g. llm_config) cannot
+        # alter the key this agent is matched on once it is pooled
+        new_agent._pool_kwargs = copy.deepcopy(kwargs)
+        return new_agent
+
+    @classmethod
+    def release(cls, agent: "PersonaAgent") -> None:
+        """
+        Return an agent obtained from acquire() to the pool.
+
+        The agent's conversation state is cleared via AG2's reset() when available.
+        Agents not created by acquire(), and agents released while the pool is full,
+        are simply dropped.
+        """
+        if agent._pool_kwargs is None:
+            return
+
+        with cls._pool_lock:
+            pool = cls._pool
+            if len(pool) >= cls.POOL_MAX_SIZE or any(pooled is agent for pooled in pool):
+                return
+
+            reset = getattr(agent, "reset", None)
+            if callable(reset):
+                reset()
+            pool.append(agent)
+
+    def _reset(
+        self,
+        name: str,
+        role: str,
+        goal: str,
+        *,
+        backstory: str,
+        constraints: list[str] | None,
+        description: str | None,
+        version: str | None,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        """Give a pooled agent a new identity and persona (see acquire())."""
+        self._set_persona(role, goal, backstory, constraints, version=version, metadata=metadata)
+        self._persona_name = name
+        if hasattr(self, "_name"):
+            # AG2 keeps its own copy of the name
+            self._name = name
+        if description is None:
+            description = f"{self.role}: {self.goal}"
+        self.description = description
+
+        self._batch_depth = 0
+        self._prompt_frozen = False
+        self._message_pending = False
+
+        system_message = self._build_system_message()
+        self._rendered_message = system_message
+        additional = (self._pool_kwargs or {}).get("system_message")
+        if additional is not None:
+            system_message = f"{system_message}\n\nAdditional Instructions:\n{additional}"
+        self.update_system_message(system_message)
+
+    def _set_persona(
+        self,
+        role: str,
+        goal: str,
+        backstory: str,
+        constraints: list[str] | None,
+        *,
+        version: str | None,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        """Store the structured persona components and reset the caches derived from them."""
+        # Roles and constraints are commonly shared by many agents; intern them
+        self.role = _intern(role)
+        self.goal = goal
+        self.backstory = backstory
+        self.constraints = constraints if constraints is not None else []
+        if isinstance(self.constraints, list):
+            # Interned in place; the list object passed in stays the one we hold
+            self.constraints[:] = [_intern(constraint) for constraint in self.constraints]
+        # (constraints list, its length, membership set) for add_constraint/remove_constraint
+        # dedupe checks; built on first use since many agents never have their
+        # constraints edited, and rebuilt if the public list is replaced or resized
+        self._constraints_set: tuple[list[str], list[str], set[str]] | None = None
+        self.version = version
+        self._metadata = metadata if metadata is not None else {}
+
+        # Rendered system message fragments reused across goal/constraint updates
+        self._prompt_header: tuple[str, str, str, str] | None = None
+        # (constraints list, snapshot of its contents, rendered section)
+        self._constraints_block: tuple[list[str], list[str], str] | None = None
+        # (role, goal, rendered repr) reused by __repr__ until role or goal is replaced
+        self._repr_cache: tuple[str, str, str] | None = None
+
     def _build_system_message(self) -> str:
         """
         Compose system message from structured components.
@@ -132,22 +335,85 @@ class PersonaAgent(ConversableAgent):
         Returns:
             str: The complete system message
         """
-        # Start with role - who the agent is
-        parts = [f"# Role: {self.role}"]
+        # Role, goal and backstory form the header; it is cached and re-rendered only
+        # when one of them is replaced, so constraint edits reuse it as-is
+        cached = self._prompt_header
+        if (
+            cached is None
+            or cached[0] is not self.role
+            or cached[1] is not self.goal
+            or cached[2] is not self.backstory
+        ):
+            cached = self._prompt_header = (
+                self.role,
+                self.goal,
+                self.backstory,
+                self._render_header(),
+            )
 
-        # Add goal - what the agent should do
-        parts.append(f"\n## Goal\n{self.goal}")
+        # Add constraints if provided - rules and limitations
+        return cached[3] + self._render_constraints()
+
+    def _render_constraints(self) -> str:
+        """Render the constraints section, reusing it until the constraints change."""
+        # The public constraints list may be replaced or edited in place, so the cached
+        # section is checked against the list's identity and a snapshot of its contents
+        constraints = self.constraints
+        cached = self._constraints_block
+        if cached is None or cached[0] is not constraints or cached[1] != constraints:
+            if not constraints:
+                text = ""
+            else:
+                try:
+                    bullets = "\n- ".join(constraints)
+                except TypeError:
+                    # Non-string constraints (e.g. numbers from YAML) render via str()
+                    bullets = "\n- ".join(map(str, constraints))
+                text = f"\n\n## Constraints\n- {bullets}"
+            cached = self._constraints_block = (constraints, list(constraints), text)
+        return cached[2]
+
+    def system_message_blocks(self) -> list[dict[str, Any]]:
+        """
+        Split the persona system message into prompt-cache friendly text blocks.
 
-        # Add backstory if provided - context and expertise
-        if self.backstory:
-            parts.append(f"\n## Background\n{self.backstory}")
+        Blocks are ordered from most to least stable: the role (static), the goal
+        and background (changed by update_goal), and the constraints (changed by
+        add_constraint/remove_constraint). The stable blocks carry Anthropic-style
+        "cache_control" markers so constraint edits do not invalidate the cached
+        identity prefix. Concatenating the block texts yields the persona system
+        message (without any additional system_message instructions).
 
-        # Add constraints if provided - rules and limitations
+        Returns:
+            list: Content blocks of the form {"type": "text", "text": ..., ...}
+
+        Example:
+            >>> client.messages.create(system=agent.system_message_blocks(), ...)
+        """
+        if self.backstory:
+            goal_text = f"\n\n## Goal\n{self.goal}\n\n## Background\n{self.backstory}"
+        else:
+            goal_text = f"\n\n## Goal\n{self.goal}"
+
+        blocks: list[dict[str, Any]] = [
+            {
+                "type": "text",
+                "text": f"# Role: {self.role}",
+                "cache_control": {"type": "ephemeral", "ttl": "1h"},
+            },
+            {"type": "text", "text": goal_text, "cache_control": {"type": "ephemeral"}},
+        ]
         if self.constraints:
-            parts.append("\n## Constraints")
-            parts.extend(f"- {constraint}" for constraint in self.constraints)
+            blocks.append({"type": "text", "text": self._render_constraints()})
+        return blocks
 
-        return "\n".join(parts)
+    def _render_header(self) -> str:
+        """Render the role, goal and optional background sections."""
+        # Role - who the agent is - then the goal it should accomplish, plus the
+        # backstory (context and expertise) when provided; one f-string per layout
+        if self.backstory:
+            return f"# Role: {self.role}\n\n## Goal\n{self.goal}\n\n## Background\n{self.backstory}"
+        return f"# Role: {self.role}\n\n## Goal\n{self.goal}"
 
     @property
     def human_input_mode(self) -> str:
@@ -167,20 +433,24 @@ class PersonaAgent(ConversableAgent):
     @name.setter
     def name(self, value: str) -> None:
         """Prevent name modification after construction."""
-        if getattr(self, "_construction_complete", False):
+        if self._construction_complete:
             raise AttributeError("PersonaAgent name is immutable after construction")
         # Allow setting during construction
         self._persona_name = value
 
     @property
-    def metadata(self) -> dict[str, Any]:
+    def metadata(self) -> Mapping[str, Any]:
         """
         Get the extensible metadata dictionary.
 
         Returns:
-            dict: Copy of the metadata dictionary to prevent external modification
+            Mapping: Read-only live view of the metadata; use update_metadata() to
+                change it. This is a Mapping, not a dict (it used to return a dict
+                copy); use dict(agent.metadata) where a real dict is needed, e.g. for
+                json.dumps().
         """
-        return self._metadata.copy()
+        # Built per access rather than stored, so agents stay copyable and picklable
+        return MappingProxyType(self._metadata)
 
     def update_metadata(self, metadata: dict[str, Any]) -> None:
         """
@@ -214,7 +484,7 @@ class PersonaAgent(ConversableAgent):
             >>> agent.update_goal("Focus on performance optimization")
         """
         self.goal = new_goal
-        self.update_system_message(self._build_system_message())
+        self._refresh_system_message()
 
     def add_constraint(self, constraint: str) -> None:
         """
@@ -226,9 +496,46 @@ class PersonaAgent(ConversableAgent):
         Example:
             >>> agent.add_constraint("Respond only with JSON")
         """
-        if constraint not in self.constraints:
-            self.constraints.append(constraint)
-            self.update_system_message(self._build_system_message())
+        constraint = _intern(constraint)
+        constraint_set = self._constraint_index()
+        if constraint in constraint_set:
+            return
+
+        constraints = self.constraints
+        # The installed message can be extended in place only if it was rendered from
+        # the current role, goal, backstory and constraints
+        block = self._constraints_block
+        header = self._prompt_header
+        in_sync = (
+            block is not None
+            and block[0] is constraints
+            and block[1] == constraints
+            and header is not None
+            and header[0] is self.role
+            and header[1] is self.goal
+            and header[2] is self.backstory
+        )
+
+        constraint_set.add(constraint)
+        constraints.append(constraint)
+        indexed = self._constraints_set
+        if indexed is not None:
+            indexed[1].append(constraint)
+
+        addition = ""
+        if block is not None and in_sync:
+            addition = f"\n- {constraint}" if block[2] else f"\n\n## Constraints\n- {constraint}"
+            block[1].append(constraint)
+            self._constraints_block = (constraints, block[1], block[2] + addition)
+
+        if self._batch_depth or self._prompt_frozen:
+            self._message_pending = True
+        # Constraints are the last section, so a message that is still exactly the
+        # rendered persona only needs the new line appended rather than a rebuild
+        elif addition and self.system_message is self._rendered_message:
+            self._apply_system_message(self._rendered_message + addition)
+        else:
+            self._apply_system_message(self._build_system_message())
 
     def remove_constraint(self, constraint: str) -> None:
         """
@@ -237,9 +544,84 @@ class PersonaAgent(ConversableAgent):
         Args:
             constraint: Constraint to remove
         """
+        # list.remove() scans the list anyway, so the list itself is the membership test
         if constraint in self.constraints:
             self.constraints.remove(constraint)
-            self.update_system_message(self._build_system_message())
+            # Rebuilt on the next add_constraint(); the list may still hold duplicates
+            self._constraints_set = None
+            self._refresh_system_message()
+
+    def _constraint_index(self) -> set[str]:
+        """Return the constraint membership set, rebuilding it if the list has changed."""
+        constraints = self.constraints
+        indexed = self._constraints_set
+        # Compare contents as well as identity: the public list can be edited in place
+        if indexed is None or indexed[0] is not constraints or indexed[1] != constraints:
+            indexed = self._constraints_set = (constraints, list(constraints), set(constraints))
+        return indexed[2]
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """
+        Defer system message regeneration until a block of updates is complete.
+
+        Goal and constraint changes made inside the block are applied with a single
+        update_system_message() call when the outermost block exits.
+
+        Example:
+            >>> with agent.batch_update():
+            ...     for rule in rules:
+            ...         agent.add_constraint(rule)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._flush_system_message()
+
+    def freeze_prompt(self) -> None:
+        """
+        Keep the current system message fixed until thaw_prompt() is called.
+
+        LLM providers cache prompt prefixes, and any change to the system message
+        invalidates that cache. While frozen, update_goal(), add_constraint() and
+        remove_constraint() still update the persona but the system message is left
+        untouched, so runtime tweaks mid-conversation keep cache hits.
+
+        Example:
+            >>> agent.freeze_prompt()
+            >>> agent.add_constraint("Answer in French")  # prompt unchanged
+            >>> agent.thaw_prompt()  # prompt rebuilt with the new constraint
+        """
+        self._prompt_frozen = True
+
+    def thaw_prompt(self) -> None:
+        """Unfreeze the system message, applying any changes made while frozen."""
+        self._prompt_frozen = False
+        self._flush_system_message()
+
+    def _refresh_system_message(self) -> None:
+        """Rebuild the system message now, or once batch_update()/freeze_prompt() allow."""
+        self._message_pending = True
+        self._flush_system_message()
+
+    def _flush_system_message(self) -> None:
+        """Apply a pending system message rebuild unless updates are being held."""
+        if self._message_pending and not self._batch_depth and not self._prompt_frozen:
+            self._message_pending = False
+            self._apply_system_message(self._build_system_message())
+
+    def _apply_system_message(self, message: str) -> None:
+        """Install a freshly rendered persona system message unless it is unchanged."""
+        # Skip the update (and any AG2 hooks behind it) when the installed message is
+        # still our last render and the new render is identical, e.g. update_goal()
+        # with the current goal
+        current = self._rendered_message
+        if self.system_message is current and message == current:
+            return
+        self._rendered_message = message
+        self.update_system_message(message)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -251,8 +633,10 @@ class PersonaAgent(ConversableAgent):
         Returns:
             dict: Persona configuration including llm_config and version
         """
+        # A plain dict literal is the cheapest way to build this snapshot; read the
+        # name from its backing field rather than through the property
         return {
-            "name": self.name,
+            "name": self._persona_name,
             "role": self.role,
             "goal": self.goal,
             "backstory": self.backstory,
@@ -264,4 +648,10 @@ class PersonaAgent(ConversableAgent):
 
     def __repr__(self) -> str:
         """String representation of the agent."""
-        return f"PersonaAgent(name='{self.name}', role='{self.role}', goal='{self.goal[:50]}...')"
+        cached = self._repr_cache
+        if cached is None or cached[0] is not self.role or cached[1] is not self.goal:
+            text = (
+                f"PersonaAgent(name='{self.name}', role='{self.role}', goal='{self.goal[:50]}...')"
+            )
+            cached = self._repr_cache = (self.role, self.goal, text)
+        return cached[2]
@@ -5,11 +5,21 @@ This module provides PersonaBuilder, which offers a more flexible and robust way
 to create PersonaAgent instances compared to direct constructor calls or from_dict methods.
 """
 
+import asyncio
+import copy
+import sys
+from collections.abc import Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-if TYPE_CHECKING:
-    from .persona_agent import PersonaAgent
+from .parsers import PersonaMarkdownParser
+from .persona_agent import PersonaAgent, _intern
+
+_HUMAN_INPUT_MODES = ("NEVER", "ALWAYS", "TERMINATE")
+_VALID_HUMAN_INPUT_MODES = frozenset(_HUMAN_INPUT_MODES)
+
+# Shared by every builder without constraints; replaced by a list on first add
+_NO_CONSTRAINTS: tuple[str, ...] = ()
 
 
 class PersonaBuilder:
@@ -36,6 +46,21 @@ class PersonaBuilder:
         ...           .build())
     """
 
+    __slots__ = (
+        "_backstory",
+        "_constraints",
+        "_constraints_set",
+        "_description",
+        "_goal_base",
+        "_goal_extensions",
+        "_llm_config",
+        "_metadata",
+        "_role",
+        "_version",
+        "additional_kwargs",
+        "name",
+    )
+
     def __init__(self, name: str | None = None):
         """
         Initialize PersonaBuilder with optional agent name.
@@ -45,9 +70,13 @@ class PersonaBuilder:
         """
         self.name = name
         self._role: str | None = None
-        self._goal: str | None = None
+        self._goal_base: str | None = None
+        # Pending extend_goal() segments, joined into _goal_base on first read
+        self._goal_extensions: list[str] = []
         self._backstory: str = ""
-        self._constraints: list[str] = []
+        self._constraints: list[str] | tuple[str, ...] = _NO_CONSTRAINTS
+        # Membership index for add_constraint(); None until first needed
+        self._constraints_set: set[str] | None = None
         self._llm_config: dict[str, Any] | bool | None = None
         self._description: str | None = None
         self._version: str | None = None
@@ -61,9 +90,23 @@ class PersonaBuilder:
 
     def role(self, role: str) -> "PersonaBuilder":
         """Set the persona's role or title."""
-        self._role = role
+        self._role = _intern(role)
         return self
 
+    @property
+    def _goal(self) -> str | None:
+        """The goal, including any extend_goal() additions."""
+        if self._goal_extensions:
+            segments = [self._goal_base or "", *self._goal_extensions]
+            self._goal_base = ". Additionally, ".join(segments)
+            self._goal_extensions.clear()
+        return self._goal_base
+
+    @_goal.setter
+    def _goal(self, goal: str | None) -> None:
+        self._goal_base = goal
+        self._goal_extensions.clear()
+
     def goal(self, goal: str) -> "PersonaBuilder":
         """Set the persona's objective or goal."""
         self._goal = goal
@@ -76,13 +119,20 @@ class PersonaBuilder:
 
     def add_constraint(self, constraint: str) -> "PersonaBuilder":
         """Add a single constraint or rule for the agent."""
-        if constraint and constraint not in self._constraints:
-            self._constraints.append(constraint)
+        if constraint:
+            if self._constraints_set is None:
+                self._constraints_set = set(self._constraints or ())
+            if constraint not in self._constraints_set:
+                if not isinstance(self._constraints, list):
+                    self._constraints = list(self._constraints or ())
+                self._constraints.append(constraint)
+                self._constraints_set.add(constraint)
         return self
 
     def constraints(self, constraints: list[str]) -> "PersonaBuilder":
         """Set multiple constraints at once, replacing any existing constraints."""
         self._constraints = constraints
+        self._constraints_set = None
         return self
 
     def llm_config(self, config: dict[str, Any]) -> "PersonaBuilder":
@@ -107,10 +157,11 @@ class PersonaBuilder:
         Raises:
             ValueError: If mode is not valid
         """
-        valid_modes = ["NEVER", "ALWAYS", "TERMINATE"]
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid human_input_mode: {mode}. Must be one of {valid_modes}")
-        self.additional_kwargs["human_input_mode"] = mode
+        if mode not in _VALID_HUMAN_INPUT_MODES:
+            raise ValueError(
+                f"Invalid human_input_mode: {mode}. Must be one of {list(_HUMAN_INPUT_MODES)}"
+            )
+        self.additional_kwargs["human_input_mode"] = sys.intern(mode)
         return self
 
     def human_input_never(self) -> "PersonaBuilder":
@@ -138,6 +189,9 @@ class PersonaBuilder:
         for users to define custom data. Core persona fields (name, role, goal, etc.)
         are NOT updated by this method.
 
+        The merge is shallow: top-level keys in metadata replace existing keys,
+        and nested dictionaries are not merged.
+
         Args:
             metadata: Dictionary containing custom metadata to merge
 
@@ -154,7 +208,7 @@ class PersonaBuilder:
         if not isinstance(metadata, dict):
             raise ValueError("Metadata must be a dictionary")
 
-        # Deep merge the metadata
+        # Shallow merge the metadata
         self._metadata.update(metadata)
         return self
 
@@ -183,19 +237,20 @@ class PersonaBuilder:
             raise ValueError(f"Configuration must be a dictionary for persona '{self.name}'")
 
         # Load persona attributes (but not llm_config for instance method backward compatibility)
-        self._role = config_dict.get("role")
+        self._role = _intern(config_dict.get("role"))
         self._goal = config_dict.get("goal")
         self._backstory = config_dict.get("backstory", "")
-        self._constraints = config_dict.get("constraints", [])
-        self._version = config_dict.get("version")
+        self._constraints = config_dict.get("constraints", _NO_CONSTRAINTS)
+        self._constraints_set = None
+        self._version = _intern(config_dict.get("version"))
 
         # Load extensible metadata
-        if "metadata" in config_dict:
-            self._metadata.update(config_dict["metadata"])
+        if metadata := config_dict.get("metadata"):
+            self._metadata.update(metadata)
 
         # Load name only if not already set (preserves instance name)
-        if not self.name and "name" in config_dict:
-            self.name = config_dict["name"]
+        if not self.name and (name := config_dict.get("name")) is not None:
+            self.name = name
 
         # Load LLM config from 'llm_config' key (matches AG2 API)
         if "llm_config" in config_dict:
@@ -269,14 +324,11 @@ class PersonaBuilder:
         """
         file_path = Path(file_path)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Persona Markdown file not found: {file_path}")
-
-        with file_path.open() as f:
-            content = f.read()
+        # Parses are cached by (path, mtime, size); unchanged files skip I/O and YAML
+        config = PersonaMarkdownParser.parse_persona_file(file_path)
 
         # Use file stem as fallback for name resolution
-        return self._load_from_markdown_content(content, file_path.stem)
+        return self._apply_markdown_config(config, file_path.stem)
 
     @classmethod
     def from_markdown(
@@ -321,6 +373,117 @@ class PersonaBuilder:
         """
         return cls().with_markdown_file(file_path)
 
+    @classmethod
+    async def from_markdown_async(
+        cls,
+        file_path: str | Path,
+        timeout: float | None = 10.0,
+    ) -> "PersonaBuilder":
+        """
+        Create PersonaBuilder from a Markdown file without blocking the event loop.
+
+        The file is read and parsed in a worker thread; see from_markdown().
+
+        Args:
+            file_path: Path to Markdown file with persona definition
+            timeout: Seconds to wait for the file to load (None waits indefinitely)
+
+        Returns:
+            PersonaBuilder: New instance with data loaded from file
+
+        Raises:
+            FileNotFoundError: If the Markdown file doesn't exist
+            ValueError: If the Markdown format is invalid
+            TimeoutError: If loading takes longer than timeout
+        """
+        file_path = Path(file_path)
+        config = await asyncio.wait_for(
+            asyncio.to_thread(PersonaMarkdownParser.parse_persona_file, file_path), timeout
+        )
+        return cls()._apply_markdown_config(config, file_path.stem)
+
+    @classmethod
+    async def from_markdown_many(
+        cls,
+        file_paths: Iterable[str | Path],
+        timeout: float | None = 10.0,
+    ) -> list["PersonaBuilder"]:
+        """
+        Load several Markdown persona files concurrently.
+
+        Reads overlap, so loading N personas from slow or network storage takes
+        roughly as long as the slowest file rather than the sum of all of them.
+
+        Args:
+            file_paths: Paths to Markdown files with persona definitions
+            timeout: Seconds to wait for each file to load (None waits indefinitely)
+
+        Returns:
+            list: PersonaBuilders in the same order as file_paths
+
+        Example:
+            >>> builders = await PersonaBuilder.from_markdown_many(["analyst.md", "critic.md"])
+            >>> agents = [builder.llm_config(config).build() for builder in builders]
+        """
+        return list(
+            await asyncio.gather(*(cls.from_markdown_async(path, timeout) for path in file_paths))
+        )
+
+    @staticmethod
+    def read_markdown_frontmatter(file_path: str | Path) -> dict[str, Any]:
+        """
+        Read a Markdown persona file's frontmatter without loading its body.
+
+        Useful for listing or filtering available personas by name, role or
+        metadata before committing to a full from_markdown() load.
+
+        Args:
+            file_path: Path to Markdown file with persona definition
+
+        Returns:
+            dict: Frontmatter fields (name, role, goal, metadata, ...)
+
+        Raises:
+            FileNotFoundError: If the Markdown file doesn't exist
+            ValueError: If the frontmatter is invalid
+
+        Example:
+            >>> roles = {p.stem: PersonaBuilder.read_markdown_frontmatter(p).get("role")
+            ...          for p in Path("personas").glob("*.md")}
+        """
+        return PersonaMarkdownParser.read_frontmatter(Path(file_path))
+
+    @staticmethod
+    def build_index(directory: str | Path) -> Path:
+        """
+        Pre-parse a directory of Markdown personas into a personas.index.json file.
+
+        Run this at build or deploy time. Afterwards from_markdown() loads unchanged
+        files in that directory from the index instead of parsing them; files edited
+        since the index was built are parsed as usual.
+
+        Args:
+            directory: Directory containing persona Markdown files
+
+        Returns:
+            Path: Path of the written index file
+
+        Example:
+            >>> PersonaBuilder.build_index("personas")
+            >>> agent = PersonaBuilder.from_markdown("personas/analyst.md").build()
+        """
+        return PersonaMarkdownParser.build_index(Path(directory))
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Discard cached Markdown persona parses.
+
+        Files are re-parsed automatically when their modification time or size
+        changes; call this to force a re-parse or to release the cached configs.
+        """
+        PersonaMarkdownParser.clear_cache()
+
     def _resolve_name(self, config: dict[str, Any], fallback_name: str | None = None) -> str:
         """
         Resolve the final name using consistent priority rules.
@@ -343,8 +506,8 @@ class PersonaBuilder:
             return self.name
 
         # Priority 2: Name from frontmatter/config
-        if config.get("name"):
-            return str(config["name"])
+        if name := config.get("name"):
+            return str(name)
 
         # Priority 3: Provided fallback
         if fallback_name:
@@ -359,42 +522,49 @@ class PersonaBuilder:
         fallback_name: str | None = None,
     ) -> "PersonaBuilder":
         """Internal method to load from markdown content."""
-        from .parsers import PersonaMarkdownParser
-
         # Parse content using simplified parser
         config = PersonaMarkdownParser.parse_persona_markdown(content)
+        return self._apply_markdown_config(config, fallback_name)
 
+    def _apply_markdown_config(
+        self,
+        config: dict[str, Any],
+        fallback_name: str | None = None,
+    ) -> "PersonaBuilder":
+        """Internal method to apply a parsed markdown persona configuration."""
         # Handle name resolution using consistent logic
         self.name = self._resolve_name(config, fallback_name)
 
-        # Apply core persona fields directly
-        if config.get("role") is not None:
-            self._role = config["role"]
-        if config.get("goal") is not None:
-            self._goal = config["goal"]
-        if config.get("backstory") is not None:
-            self._backstory = config["backstory"]
-        if config.get("constraints") is not None:
-            self._constraints = config["constraints"]
-        if config.get("llm_config") is not None:
-            self._llm_config = config["llm_config"]
-        if config.get("description") is not None:
-            self._description = config["description"]
-        if config.get("version") is not None:
-            self._version = config["version"]
+        # Apply core persona fields directly, one lookup per key
+        if (role := config.get("role")) is not None:
+            self._role = _intern(role)
+        if (goal := config.get("goal")) is not None:
+            self._goal = goal
+        if (backstory := config.get("backstory")) is not None:
+            self._backstory = backstory
+        if (constraints := config.get("constraints")) is not None:
+            self._constraints = constraints
+            self._constraints_set = None
+        if (llm_config := config.get("llm_config")) is not None:
+            self._llm_config = llm_config
+        if (description := config.get("description")) is not None:
+            self._description = description
+        if (version := config.get("version")) is not None:
+            self._version = _intern(version)
 
         # Apply extensible metadata
-        if config.get("metadata"):
-            self._metadata.update(config["metadata"])
+        if metadata := config.get("metadata"):
+            self._metadata.update(metadata)
 
         return self
 
     def extend_goal(self, additional_goal: str) -> "PersonaBuilder":
         """Extend the existing goal with additional requirements."""
-        if self._goal:
-            self._goal = f"{self._goal}. Additionally, {additional_goal}"
+        # Segments are joined once when the goal is read, so chained calls stay linear
+        if self._goal_extensions or self._goal_base:
+            self._goal_extensions.append(additional_goal)
         else:
-            self._goal = additional_goal
+            self._goal_base = additional_goal
         return self
 
     @classmethod
@@ -420,12 +590,67 @@ class PersonaBuilder:
         builder_name = name or config_dict.get("name")
         return cls(builder_name).from_dict(config_dict)
 
+    @classmethod
+    def build_many(cls, configs: Iterable[dict[str, Any]]) -> list["PersonaAgent"]:
+        """
+        Build PersonaAgents from a batch of persona configuration dictionaries.
+
+        Every configuration is validated before any agent is constructed, and all
+        failures are reported together instead of stopping at the first one.
+
+        Args:
+            configs: Persona configuration dictionaries (see from_persona_dict())
+
+        Returns:
+            list[PersonaAgent]: Built agents, in the same order as configs
+
+        Raises:
+            ValueError: If any configuration is invalid, listing each failure by index
+
+        Example:
+            >>> catalog = yaml.safe_load(Path("personas.yaml").read_text())
+            >>> agents = PersonaBuilder.build_many(catalog["personas"])
+        """
+        builders = []
+        errors = []
+        for index, config in enumerate(configs):
+            if not isinstance(config, dict):
+                errors.append(f"  - [{index}] Configuration must be a dictionary")
+                continue
+            try:
+                builders.append(cls.from_persona_dict(config).validate())
+            except ValueError as e:
+                errors.append(f"  - [{index}] {e}")
+
+        if errors:
+            raise ValueError("Persona batch validation failed:\n" + "\n".join(errors))
+
+        return [builder.build() for builder in builders]
+
     def validate(self) -> "PersonaBuilder":
         """Validate the current configuration before building.
 
         Raises:
             ValueError: If validation fails with detailed error messages
         """
+        # Fast path: a complete configuration needs none of the error reporting below
+        llm_config = self._llm_config
+        if (
+            self.name
+            and self._role
+            and self._goal
+            and (not self._constraints or isinstance(self._constraints, list))
+            and (
+                llm_config is None
+                or llm_config is False
+                or (
+                    isinstance(llm_config, dict)
+                    and ("config_list" in llm_config or "model" in llm_config)
+                )
+            )
+        ):
+            return self
+
         errors = []
 
         if not self.name:
@@ -447,7 +672,7 @@ class PersonaBuilder:
                 errors.append(
                     f"LLM config must be a dictionary for persona '{self.name}', got {type(self._llm_config)}"
                 )
-            elif not any(key in self._llm_config for key in ("config_list", "model")):
+            elif "config_list" not in self._llm_config and "model" not in self._llm_config:
                 errors.append(
                     f"LLM config must contain 'config_list' or 'model' for persona '{self.name}'"
                 )
@@ -460,19 +685,22 @@ class PersonaBuilder:
 
         return self
 
-    def build(self) -> "PersonaAgent":
+    def build(self, *, pooled: bool = False) -> "PersonaAgent":
         """
         Build the PersonaAgent instance with validation.
 
+        Args:
+            pooled: Take the agent from PersonaAgent's pool of released agents when
+                one was built with the same LLM config and agent kwargs, instead of
+                constructing a new one. Hand such agents back with
+                PersonaAgent.release() when the conversation is over.
+
         Returns:
             PersonaAgent: The constructed agent instance
 
         Raises:
             ValueError: If validation fails
         """
-        # Import here to avoid circular imports
-        from .persona_agent import PersonaAgent
-
         # Validate before building
         self.validate()
 
@@ -481,19 +709,36 @@ class PersonaBuilder:
         assert self._role is not None, "Role should be set after validation"
         assert self._goal is not None, "Goal should be set after validation"
 
-        # Add version and metadata to kwargs if set
-        kwargs = self.additional_kwargs.copy()
-        if self._version is not None:
-            kwargs["version"] = self._version
-        if self._metadata:
-            kwargs["metadata"] = self._metadata
+        # Add version and metadata to kwargs if set. ** unpacking gives PersonaAgent
+        # its own kwargs dict, so additional_kwargs is only copied when extras exist.
+        kwargs = self.additional_kwargs
+        if self._version is not None or self._metadata:
+            kwargs = kwargs.copy()
+            if self._version is not None:
+                kwargs["version"] = self._version
+            if self._metadata:
+                kwargs["metadata"] = self._metadata
+
+        if pooled:
+            return PersonaAgent.acquire(
+                self.name,
+                self._role,
+                self._goal,
+                backstory=self._backstory,
+                constraints=list(self._constraints or ()),
+                description=self._description,
+                # The agent outlives this build in the pool, so it must not share the
+                # builder's llm_config dict that temperature() edits in place
+                llm_config=copy.deepcopy(self._llm_config),
+                **kwargs,
+            )
 
         return PersonaAgent(
             name=self.name,
             role=self._role,
             goal=self._goal,
             backstory=self._backstory,
-            constraints=self._constraints,
+            constraints=list(self._constraints or ()),
             description=self._description,
             llm_config=self._llm_config,
             **kwargs,
@@ -501,11 +746,9 @@ class PersonaBuilder:
 
     def __repr__(self) -> str:
         """String representation of the builder."""
-        if self._goal is None:
-            goal_display = "None"
-        elif len(self._goal) > 30:  # noqa: PLR2004
-            goal_display = f"'{self._goal[:30]}...'"
-        else:
-            goal_display = f"'{self._goal}'"
+        goal = self._goal
+        goal_display = (
+            "None" if goal is None else f"'{goal[:30]}...'" if len(goal) > 30 else f"'{goal}'"  # noqa: PLR2004
+        )
 
         return f"PersonaBuilder(name='{self.name}', role='{self._role}', goal={goal_display})"
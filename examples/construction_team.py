@@ -188,7 +188,7 @@ def main() -> None:
         print("\nThis likely means:")
         print("1. AG2 not properly installed with LLM support")
         print("2. No LLM configured or API key missing")
-        print("3. Missing ruamel.yaml: pip install ruamel.yaml  # for YAML frontmatter parsing")
+        print("3. Missing PyYAML: pip install PyYAML  # for YAML frontmatter parsing")
         print("\nInstallation options:")
         print('  OpenAI: pip install "ag2[openai]" && export OPENAI_API_KEY=key')
         print("  Ollama: pip install ag2 (local models, no API key needed)")
@@ -240,3 +240,306 @@ async def test_async_with_kwargs():
         # Mock ConversableAgent stores kwargs directly
         assert hasattr(agent, "is_termination_msg")
         assert agent.is_termination_msg is not None
+
+
+@pytest.mark.asyncio
+async def test_async_setters_after_markdown_keep_call_order():
+    """Test setters chained after from_markdown are applied after the file loads."""
+    markdown_content = """---
+role: Engineer
+goal: Build software
+constraints:
+  - Write tests
+llm_config:
+  model: gpt-4
+---
+
+# Backstory
+Experienced engineer who loves building software solutions.
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+        f.write(markdown_content)
+        md_path = f.name
+
+    try:
+        builder = AsyncPersonaBuilder("ordered").role("Ignored Role")
+        assert not builder._steps  # Plain setters apply immediately
+
+        agent = await (
+            builder.from_markdown(md_path)
+            .extend_goal("focus on reliability")
+            .add_constraint("Review code")
+            .llm_config(False)
+            .build()
+        )
+
+        assert agent.role == "Engineer"
+        assert agent.goal == "Build software. Additionally, focus on reliability"
+        assert agent.constraints == ["Write tests", "Review code"]
+        assert agent.llm_config is False
+    finally:
+        Path(md_path).unlink()
+
+
+@pytest.mark.asyncio
+async def test_async_from_markdown_missing_file():
+    """Test AsyncPersonaBuilder.from_markdown reports a missing file during build()."""
+    builder = AsyncPersonaBuilder("missing").from_markdown("/nonexistent/persona.md")
+
+    with pytest.raises(FileNotFoundError, match="Persona Markdown file not found"):
+        await builder.build()
+
+
+@pytest.mark.asyncio
+async def test_async_add_constraint_deduplicates():
+    """Test add_constraint skips constraints that are already present."""
+    agent = await (
+        AsyncPersonaBuilder("dedupe")
+        .role("Test Role")
+        .goal("Test Goal")
+        .constraints(["Be concise"])
+        .add_constraint("Be concise")
+        .add_constraint("Cite sources")
+        .add_constraint("Cite sources")
+        .llm_config(False)
+        .build()
+    )
+
+    assert agent.constraints == ["Be concise", "Cite sources"]
+
+
+def test_run_with_fast_loop_builds_agent():
+    """Test run_with_fast_loop runs a build coroutine with or without uvloop."""
+    from ag2_persona import run_with_fast_loop
+
+    agent = run_with_fast_loop(
+        AsyncPersonaBuilder("looped").role("Test Role").goal("Test Goal").llm_config(False).build()
+    )
+
+    assert agent.name == "looped"
+
+
+@pytest.mark.asyncio
+async def test_async_build_many():
+    """Test AsyncPersonaBuilder.build_many builds agents concurrently in order."""
+    markdown_template = """---
+role: {role}
+goal: Build software
+---
+
+# Backstory
+Experienced engineer who loves building software solutions.
+"""
+
+    paths = []
+    try:
+        for role in ("Backend Engineer", "Frontend Engineer"):
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+                f.write(markdown_template.format(role=role))
+                paths.append(f.name)
+
+        agents = await AsyncPersonaBuilder.build_many(
+            AsyncPersonaBuilder(f"agent_{i}").from_markdown(path).llm_config(False)
+            for i, path in enumerate(paths)
+        )
+
+        assert [agent.name for agent in agents] == ["agent_0", "agent_1"]
+        assert [agent.role for agent in agents] == ["Backend Engineer", "Frontend Engineer"]
+    finally:
+        for path in paths:
+            Path(path).unlink()
+
+
+@pytest.mark.asyncio
+async def test_async_invalid_llm_config():
+    """Test AsyncPersonaBuilder rejects llm_config without a model source."""
+    builder = AsyncPersonaBuilder("bad_llm").role("Test Role").goal("Test Goal").temperature(0.5)
+
+    with pytest.raises(ValueError, match="LLM config must contain one of"):
+        await builder.build()
+
+
+@pytest.mark.asyncio
+async def test_async_temperature():
+    """Test temperature() creates or updates the LLM config dictionary."""
+    agent = await (
+        AsyncPersonaBuilder("temp_test")
+        .role("Test Role")
+        .goal("Test Goal")
+        .temperature(0.2)
+        .add_kwargs(human_input_mode="NEVER")
+        .llm_config({"model": "gpt-4"})
+        .temperature(0.7)
+        .build()
+    )
+
+    assert agent.llm_config["model"] == "gpt-4"
+    assert agent.llm_config["temperature"] == 0.7
+
+    with pytest.raises(ValueError, match="to set temperature"):
+        AsyncPersonaBuilder("bad_temp").llm_config(True).temperature(0.5)
+
+
+@pytest.mark.asyncio
+async def test_async_from_json():
+    """Test AsyncPersonaBuilder.from_json loads persona attributes from a JSON file."""
+    import json
+
+    config = {
+        "name": "ignored_name",
+        "role": "Data Analyst",
+        "goal": "Analyze data efficiently",
+        "backstory": "Expert in data analysis",
+        "constraints": ["Focus on accuracy"],
+    }
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(config, f)
+        json_path = f.name
+
+    try:
+        agent = await (
+            AsyncPersonaBuilder("analyst")
+            .from_json(json_path)
+            .add_constraint("Provide visualizations")
+            .llm_config(False)
+            .build()
+        )
+
+        assert agent.name == "analyst"
+        assert agent.role == "Data Analyst"
+        assert agent.backstory == "Expert in data analysis"
+        assert agent.constraints == ["Focus on accuracy", "Provide visualizations"]
+    finally:
+        Path(json_path).unlink()
+
+    with pytest.raises(FileNotFoundError, match="Persona JSON file not found"):
+        await AsyncPersonaBuilder("missing").from_json("/nonexistent/persona.json").build()
+
+
+@pytest.mark.asyncio
+async def test_async_from_dict_treats_null_constraints_as_empty():
+    """Test "constraints: null" builds an agent without constraints."""
+    config = {"role": "Role", "goal": "Goal", "constraints": None}
+
+    agent = await AsyncPersonaBuilder("planner").from_dict(config).llm_config(False).build()
+    assert agent.constraints == []
+
+    agent = await (
+        AsyncPersonaBuilder("planner")
+        .from_dict(config)
+        .add_constraint("Be brief")
+        .llm_config(False)
+        .build()
+    )
+    assert agent.constraints == ["Be brief"]
+
+
+@pytest.mark.asyncio
+async def test_async_from_json_round_trips_to_dict(tmp_path):
+    """Test an agent saved with to_dict() is rebuilt from JSON without losing fields."""
+    import json
+
+    from ag2_persona import PersonaAgent
+
+    original = PersonaAgent(
+        name="analyst",
+        role="Data Analyst",
+        goal="Analyze data",
+        constraints=["Cite sources"],
+        llm_config=False,
+        version="2.1",
+        metadata={"team": "research"},
+    )
+    json_path = tmp_path / "analyst.json"
+    json_path.write_text(json.dumps(original.to_dict()))
+
+    agent = await AsyncPersonaBuilder("analyst").from_json(json_path).build()
+
+    assert agent.to_dict() == original.to_dict()
+
+    # A later llm_config() in the chain still wins over the file
+    override = await (
+        AsyncPersonaBuilder("analyst").from_json(json_path).llm_config({"model": "gpt-4"}).build()
+    )
+    assert override.llm_config == {"model": "gpt-4"}
+
+
+@pytest.mark.asyncio
+async def test_async_from_markdown_reuses_cached_parse():
+    """Test repeated loads of an unchanged file reuse the parse without sharing state."""
+    import os
+    from unittest.mock import patch
+
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    markdown_content = """---
+role: Engineer
+goal: Build software
+constraints:
+  - Write tests
+---
+
+# Backstory
+Experienced engineer who loves building software solutions.
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+        f.write(markdown_content)
+        md_path = f.name
+
+    try:
+        PersonaMarkdownParser.clear_cache()
+        with patch.object(
+            PersonaMarkdownParser, "_parse_content", wraps=PersonaMarkdownParser._parse_content
+        ) as mock_parse:
+            first = await (
+                AsyncPersonaBuilder("first")
+                .from_markdown(md_path)
+                .add_constraint("Review code")
+                .llm_config(False)
+                .build()
+            )
+            second = (
+                await AsyncPersonaBuilder("second").from_markdown(md_path).llm_config(False).build()
+            )
+
+            assert mock_parse.call_count == 1
+            assert first.constraints == ["Write tests", "Review code"]
+            assert second.constraints == ["Write tests"]  # Cached config was not mutated
+
+            # Editing the file invalidates the cached parse
+            Path(md_path).write_text(markdown_content.replace("Engineer", "Architect"))
+            stat = Path(md_path).stat()
+            os.utime(md_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third = (
+                await AsyncPersonaBuilder("third").from_markdown(md_path).llm_config(False).build()
+            )
+
+            assert mock_parse.call_count == 2
+            assert third.role == "Architect"
+    finally:
+        Path(md_path).unlink()
+        PersonaMarkdownParser.clear_cache()
+
+
+@pytest.mark.asyncio
+async def test_async_build_retry_after_failed_step(tmp_path):
+    """A failed build() keeps the unrun steps queued so a retry applies them."""
+    path = tmp_path / "late.md"
+    builder = AsyncPersonaBuilder("late").role("R").goal("G").from_markdown(path).llm_config(False)
+
+    with pytest.raises(FileNotFoundError):
+        await builder.build()
+
+    path.write_text(
+        "---\nrole: FileRole\ngoal: FileGoal\nversion: '1.0'\nconstraints:\n  - c1\n---\n\n"
+        "# Backstory\nBS\n"
+    )
+    agent = await builder.build()
+
+    assert agent.role == "FileRole"
+    assert agent.constraints == ["c1"]
+    assert agent.backstory == "BS"
+    assert agent.llm_config is False
@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from ag2_persona import PersonaBuilder
 
 
@@ -199,3 +201,132 @@ Fallback test persona.
 
     finally:
         temp_path.unlink()
+
+
+def test_add_constraint_deduplicates_after_constraints_replaced():
+    """add_constraint() stays in sync when constraints() replaces the list."""
+    builder = PersonaBuilder("dedupe").add_constraint("Be concise").add_constraint("Be concise")
+    assert builder._constraints == ["Be concise"]
+
+    builder.constraints(["Cite sources"]).add_constraint("Cite sources").add_constraint(
+        "Be concise"
+    )
+    assert builder._constraints == ["Cite sources", "Be concise"]
+
+
+def test_validate_reports_errors_and_accepts_complete_config():
+    """validate() passes complete configurations and lists every problem otherwise."""
+    builder = PersonaBuilder("checker").role("Checker").goal("Check things")
+    assert builder.validate() is builder
+    assert builder.llm_config({"model": "gpt-4"}).validate() is builder
+
+    builder.llm_config({"temperature": 0.1})
+    with pytest.raises(ValueError, match="must contain 'config_list' or 'model'"):
+        builder.validate()
+
+    with pytest.raises(ValueError, match="Role is required") as exc_info:
+        PersonaBuilder("incomplete").goal("Goal only").validate()
+    assert "Goal is required" not in str(exc_info.value)
+
+    with pytest.raises(ValueError, match="Invalid human_input_mode"):
+        PersonaBuilder("checker").human_input_mode("SOMETIMES")
+
+
+def test_build_pooled_reuses_released_agent():
+    """build(pooled=True) hands out released agents built with the same configuration."""
+    from ag2_persona import PersonaAgent
+
+    builder = PersonaBuilder("judge").role("Judge").goal("Pick the best answer").llm_config(False)
+    PersonaAgent._pool.clear()
+    try:
+        first = builder.build(pooled=True)
+        PersonaAgent.release(first)
+
+        second = builder.set_name("judge_2").add_constraint("Be impartial").build(pooled=True)
+        assert second is first
+        assert second.name == "judge_2"
+        assert second.constraints == ["Be impartial"]
+
+        assert builder.build() is not second
+    finally:
+        PersonaAgent._pool.clear()
+
+
+def test_pooled_agents_keep_the_config_they_were_built_with():
+    """Editing the builder's llm_config after build(pooled=True) does not affect pooling."""
+    from ag2_persona import PersonaAgent
+
+    builder = PersonaBuilder("judge").role("Judge").goal("Pick").llm_config({"model": "gpt-4"})
+    PersonaAgent._pool.clear()
+    try:
+        cold = builder.temperature(0.0).build(pooled=True)
+        PersonaAgent.release(cold)
+
+        builder.temperature(0.9)
+        assert cold.llm_config == {"model": "gpt-4", "temperature": 0.0}
+        warm = builder.build(pooled=True)
+        assert warm is not cold
+        assert warm.llm_config == {"model": "gpt-4", "temperature": 0.9}
+
+        builder.temperature(0.0)
+        assert builder.build(pooled=True) is cold
+    finally:
+        PersonaAgent._pool.clear()
+
+
+def test_build_many_validates_whole_batch():
+    """build_many() builds every config in order, or reports all invalid ones at once."""
+    configs = [
+        {"name": "analyst", "role": "Analyst", "goal": "Analyze", "llm_config": False},
+        {"name": "critic", "role": "Critic", "goal": "Critique", "llm_config": False},
+    ]
+    agents = PersonaBuilder.build_many(configs)
+    assert [agent.name for agent in agents] == ["analyst", "critic"]
+
+    with pytest.raises(ValueError, match="Persona batch validation failed") as exc_info:
+        PersonaBuilder.build_many([configs[0], {"name": "no_role", "goal": "Goal"}, "not a dict"])
+    message = str(exc_info.value)
+    assert "[1]" in message and "Role is required" in message
+    assert "[2] Configuration must be a dictionary" in message
+    assert "[0]" not in message
+
+
+def test_extend_goal_chained_calls():
+    """Chained extend_goal() calls join in order; goal() replaces pending extensions."""
+    builder = PersonaBuilder("planner").goal("Plan").extend_goal("Estimate").extend_goal("Review")
+    assert builder._goal == "Plan. Additionally, Estimate. Additionally, Review"
+
+    builder.extend_goal("Report").goal("Replan")
+    assert builder._goal == "Replan"
+
+
+def test_built_agents_get_their_own_constraint_lists():
+    """Builders start with a shared empty default; each built agent gets its own list."""
+    assert PersonaBuilder("a")._constraints is PersonaBuilder("b")._constraints
+
+    builder = PersonaBuilder("template").role("Role").goal("Goal").llm_config(False)
+    builder.add_constraint("Be brief")
+    first = builder.build()
+    second = builder.build()
+    first.add_constraint("Only for the first agent")
+
+    assert second.constraints == ["Be brief"]
+    assert builder._constraints == ["Be brief"]
+
+
+def test_null_constraints_build_an_agent_without_constraints():
+    """A persona dict with "constraints: null" builds like one without constraints."""
+    config = {"name": "planner", "role": "Role", "goal": "Goal", "constraints": None}
+
+    from ag2_persona import PersonaAgent
+
+    builder = PersonaBuilder.from_persona_dict(config).llm_config(False)
+    assert builder.build().constraints == []
+    PersonaAgent._pool.clear()
+    try:
+        assert builder.build(pooled=True).constraints == []
+    finally:
+        PersonaAgent._pool.clear()
+
+    builder.add_constraint("Be brief")
+    assert builder.build().constraints == ["Be brief"]
@@ -5,7 +5,9 @@ This module contains comprehensive tests for the PersonaAgent implementation,
 ensuring reliability and compatibility with AG2 patterns.
 """
 
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from ag2_persona.persona_agent import AG2_AVAILABLE, PersonaAgent
 
@@ -123,6 +125,235 @@ class TestPersonaAgent(unittest.TestCase):
         agent.remove_constraint("Non-existent")
         self.assertEqual(len(agent.constraints), 1)
 
+    def test_system_message_layout_after_updates(self):
+        """Test the exact system message layout survives goal and constraint updates."""
+        agent = PersonaAgent(
+            name="test",
+            role="Tester",
+            goal="Test system",
+            backstory="QA lead",
+            constraints=["Be polite"],
+        )
+
+        agent.add_constraint("Be brief")
+        agent.update_goal("Test everything")
+        agent.remove_constraint("Be polite")
+
+        self.assertEqual(
+            agent.system_message,
+            "# Role: Tester\n\n## Goal\nTest everything\n\n## Background\nQA lead"
+            "\n\n## Constraints\n- Be brief",
+        )
+
+    def test_add_constraint_matches_full_rebuild(self):
+        """Test appending constraints in place yields the same message as a rebuild."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system", backstory="QA")
+
+        agent.add_constraint("Be polite")
+        agent.add_constraint("Be brief")
+
+        self.assertEqual(agent.system_message, agent._build_system_message())
+        self.assertTrue(agent.system_message.endswith("## Constraints\n- Be polite\n- Be brief"))
+
+    def test_system_message_reflects_replaced_backstory(self):
+        """Test the cached prompt header is re-rendered when a component is replaced."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system", backstory="Old")
+
+        agent.backstory = "New background"
+        agent.remove_constraint("Missing")  # no-op, message untouched
+        agent.update_goal("Test more")
+
+        self.assertIn("## Background\nNew background", agent.system_message)
+        self.assertNotIn("Old", agent.system_message)
+
+    def test_system_message_reflects_reassigned_constraints(self):
+        """Test the cached constraints section follows changes to the public list."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system", constraints=["c1"])
+
+        agent.constraints = ["x1", "x2"]
+        agent.update_goal("G2")
+        self.assertTrue(agent.system_message.endswith("## Constraints\n- x1\n- x2"))
+        self.assertNotIn("- c1", agent.system_message)
+
+        agent.constraints.append("x3")
+        agent.add_constraint("x4")
+        self.assertEqual(agent.system_message, agent._build_system_message())
+        self.assertTrue(agent.system_message.endswith("- x2\n- x3\n- x4"))
+
+    def test_constraint_index_follows_public_list(self):
+        """Test dedupe checks stay correct after the constraints list is edited directly."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system", constraints=["c1"])
+        agent.add_constraint("c2")
+
+        agent.constraints.append("c3")
+        agent.remove_constraint("c3")
+        self.assertEqual(agent.constraints, ["c1", "c2"])
+
+        agent.to_dict()["constraints"].append("zz")
+        agent.add_constraint("zz")
+        self.assertEqual(agent.constraints, ["c1", "c2", "zz"])
+
+        # Replacing an item keeps the length, so only a contents check notices it
+        agent.constraints[0] = "b"
+        agent.add_constraint("c1")
+        self.assertEqual(agent.constraints, ["b", "c2", "zz", "c1"])
+        self.assertIn("- c1", agent.system_message)
+
+    def test_agent_with_metadata_can_be_copied_and_pickled(self):
+        """Test the read-only metadata view does not make agents uncopyable."""
+        import copy
+        import pickle
+
+        agent = PersonaAgent(
+            name="test", role="Tester", goal="Test system", metadata={"team": "qa"}
+        )
+
+        self.assertEqual(copy.deepcopy(agent).metadata, {"team": "qa"})
+        self.assertEqual(pickle.loads(pickle.dumps(agent)).metadata, {"team": "qa"})
+        with self.assertRaises(TypeError):
+            agent.metadata["team"] = "dev"  # type: ignore[index]
+
+    def test_batch_update_applies_message_once(self):
+        """Test batch_update defers system message regeneration to the outermost exit."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system")
+        original_message = agent.system_message
+        calls = []
+        agent.update_system_message = calls.append
+
+        with agent.batch_update():
+            agent.add_constraint("Be polite")
+            with agent.batch_update():
+                agent.add_constraint("Be brief")
+                agent.update_goal("Test everything")
+            agent.remove_constraint("Be polite")
+            self.assertEqual(calls, [])
+            self.assertEqual(agent.system_message, original_message)
+
+        self.assertEqual(calls, [agent._build_system_message()])
+        self.assertIn("Test everything", calls[0])
+        self.assertIn("- Be brief", calls[0])
+        self.assertNotIn("Be polite", calls[0])
+
+    def test_freeze_prompt_holds_system_message(self):
+        """Test a frozen prompt keeps its system message until thawed."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system")
+        original_message = agent.system_message
+
+        agent.freeze_prompt()
+        agent.add_constraint("Be polite")
+        agent.update_goal("Test everything")
+
+        self.assertEqual(agent.constraints, ["Be polite"])
+        self.assertEqual(agent.system_message, original_message)
+
+        agent.thaw_prompt()
+
+        self.assertIn("Test everything", agent.system_message)
+        self.assertIn("- Be polite", agent.system_message)
+
+    def test_system_message_blocks(self):
+        """Test cache-friendly blocks concatenate to the persona system message."""
+        agent = PersonaAgent(
+            name="test",
+            role="Tester",
+            goal="Test system",
+            backstory="QA lead",
+            constraints=["Be polite"],
+        )
+
+        blocks = agent.system_message_blocks()
+
+        self.assertEqual(len(blocks), 3)
+        self.assertEqual(blocks[0]["text"], "# Role: Tester")
+        self.assertIn("cache_control", blocks[0])
+        self.assertIn("cache_control", blocks[1])
+        self.assertNotIn("cache_control", blocks[2])
+        self.assertEqual("".join(block["text"] for block in blocks), agent.system_message)
+
+        agent.remove_constraint("Be polite")
+        self.assertEqual(len(agent.system_message_blocks()), 2)
+
+    def test_acquire_release_reuses_agents(self):
+        """Test pooled agents are reused with a fresh persona and matching kwargs."""
+        PersonaAgent._pool.clear()
+        try:
+            first = PersonaAgent.acquire(
+                "judge_1",
+                "Judge",
+                "Pick the best answer",
+                constraints=["Be fair"],
+                llm_config=False,
+            )
+            first.add_constraint("Be quick")
+            PersonaAgent.release(first)
+            PersonaAgent.release(first)  # double release is ignored
+            self.assertEqual(len(PersonaAgent._pool), 1)
+
+            # Different ConversableAgent kwargs never share a pooled agent
+            other = PersonaAgent.acquire("judge_x", "Judge", "Pick", llm_config={"model": "x"})
+            self.assertIsNot(other, first)
+
+            second = PersonaAgent.acquire(
+                "judge_2", "Reviewer", "Review answers", backstory="Editor", llm_config=False
+            )
+            self.assertIs(second, first)
+            self.assertEqual(second.name, "judge_2")
+            self.assertEqual(second.constraints, [])
+            self.assertEqual(second.description, "Reviewer: Review answers")
+            self.assertEqual(
+                second.system_message,
+                "# Role: Reviewer\n\n## Goal\nReview answers\n\n## Background\nEditor",
+            )
+
+            # Directly constructed agents are not pooled
+            PersonaAgent.release(PersonaAgent(name="plain", role="R", goal="G"))
+            self.assertEqual(PersonaAgent._pool, [])
+        finally:
+            PersonaAgent._pool.clear()
+
+    def test_acquire_release_from_threads_never_shares_agents(self):
+        """Test concurrent acquire()/release() never hands one agent to two callers."""
+        PersonaAgent._pool.clear()
+        in_use: set[int] = set()
+        guard = threading.Lock()
+        shared: list[str] = []
+
+        def worker(worker_id: int) -> None:
+            for _ in range(200):
+                agent = PersonaAgent.acquire(
+                    f"judge_{worker_id}", "Judge", "Pick", llm_config=False
+                )
+                with guard:
+                    if id(agent) in in_use:
+                        shared.append(agent.name)
+                    in_use.add(id(agent))
+                with guard:
+                    in_use.discard(id(agent))
+                PersonaAgent.release(agent)
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(worker, range(8)))
+            self.assertEqual(shared, [])
+            self.assertLessEqual(len(PersonaAgent._pool), 8)
+            self.assertEqual(
+                len({id(agent) for agent in PersonaAgent._pool}), len(PersonaAgent._pool)
+            )
+        finally:
+            PersonaAgent._pool.clear()
+
+    def test_unchanged_system_message_is_not_reapplied(self):
+        """Test update_goal with the current goal skips update_system_message."""
+        agent = PersonaAgent(name="test", role="Tester", goal="Test system")
+        calls = []
+        agent.update_system_message = calls.append
+
+        agent.update_goal("Test system")
+        self.assertEqual(calls, [])
+
+        agent.update_goal("Test more")
+        self.assertEqual(len(calls), 1)
+
     def test_backward_compatibility(self):
         """Test that additional system_message is preserved."""
         agent = PersonaAgent(
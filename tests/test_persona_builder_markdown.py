@@ -889,13 +889,14 @@ def test_persona_agent_metadata_api():
     builder._llm_config = False
     agent = builder.build()
 
-    # Test metadata property returns copy
+    # Test metadata property returns a read-only view
     metadata = agent.metadata
     assert metadata["created_at"] == "2024-09-26"
     assert metadata["project"] == "test_project"
 
-    # Verify it's a copy (modifying returned dict doesn't affect agent)
-    metadata["modified"] = True
+    # Verify the view cannot be used to modify the agent's metadata
+    with pytest.raises(TypeError):
+        metadata["modified"] = True  # type: ignore[index]
     assert "modified" not in agent.metadata
 
     # Test update_metadata
@@ -982,3 +983,333 @@ Test backstory without version
         builder._llm_config = False  # Disable LLM for testing
         agent = builder.build()
         assert agent.version == expected_date
+
+
+def test_parse_persona_markdown_caches_identical_content():
+    """Test identical Markdown content is parsed once and callers get independent copies."""
+    from unittest.mock import patch
+
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    markdown_content = """---
+name: cached_agent
+role: Test Role
+goal: Test Goal
+version: "1.0"
+constraints:
+  - Be concise
+---
+
+# Backstory
+Test backstory for caching
+"""
+
+    PersonaMarkdownParser.clear_cache()
+    try:
+        with patch.object(
+            PersonaMarkdownParser, "_parse_content", wraps=PersonaMarkdownParser._parse_content
+        ) as mock_parse:
+            first = PersonaMarkdownParser.parse_persona_markdown(markdown_content)
+            first["constraints"].append("Mutated")
+            second = PersonaMarkdownParser.parse_persona_markdown(markdown_content)
+
+        assert mock_parse.call_count == 1
+        assert second["constraints"] == ["Be concise"]
+        assert second["version"] == "1.0"
+    finally:
+        PersonaMarkdownParser.clear_cache()
+
+
+def test_markdown_section_headers():
+    """Only '#' and '##' headers followed by whitespace start a new section."""
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    sections = PersonaMarkdownParser._parse_markdown_sections(
+        "intro text\n  #  Backstory  \nLine one\n### Details\n#hashtag\n##\tKey Facts\nFact\n#\n"
+    )
+
+    assert sections == {
+        "backstory": "Line one\n### Details\n#hashtag",
+        "key_facts": "Fact\n#",
+    }
+
+
+def test_markdown_parse_reports_missing_dependency(monkeypatch):
+    """A missing frontmatter library is reported when Markdown is first parsed."""
+    from ag2_persona import parsers
+
+    monkeypatch.setattr(
+        parsers, "_MARKDOWN_IMPORT_ERROR", ImportError("No module named 'frontmatter'")
+    )
+
+    with pytest.raises(ImportError, match="python-frontmatter is required"):
+        parsers.PersonaMarkdownParser._parse_content("---\nrole: R\n---\n")
+
+
+def test_split_frontmatter_matches_python_frontmatter():
+    """The direct '---' splitter agrees with python-frontmatter."""
+    import frontmatter
+
+    from ag2_persona.parsers import PersonaMarkdownParser, _frontmatter_handler
+
+    samples = [
+        "---\nrole: R\ngoal: G\n---\n\n# Backstory\nText\n",
+        "---\r\nrole: R\r\n---\r\n# Backstory\r\nText\r\n",
+        "---\nrole: R\n---",
+        "---\n---\n# Backstory\nText",
+        "# Backstory\nNo frontmatter",
+        "---\nrole: R\ngoal: G\n--- \n\n# Backstory\nPart one\n\n---\n\nPart two\n",
+        "---\nrole: R\ngoal: |\n  line1\n  line2\n---\n\n# Backstory\nText\n",
+        "---\nrole: R\ngoal: |\n  line1\n  line2\n---",
+    ]
+
+    for content in samples:
+        post = frontmatter.loads(content, handler=_frontmatter_handler())
+        assert PersonaMarkdownParser._split_frontmatter(content) == (post.metadata, post.content)
+
+    # A trailing "|" block keeps its clip-chomped final newline
+    metadata, _ = PersonaMarkdownParser._split_frontmatter(samples[-1])
+    assert metadata["goal"] == "line1\nline2\n"
+
+
+def test_with_markdown_file_reuses_cached_parse():
+    """Unchanged files are parsed once; PersonaBuilder.clear_cache() forces a re-parse."""
+    from unittest.mock import patch
+
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    markdown_content = """---
+role: Cached Role
+goal: Cached Goal
+version: "1.0"
+---
+
+# Backstory
+Cached backstory
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+        f.write(markdown_content)
+        temp_path = Path(f.name)
+
+    PersonaBuilder.clear_cache()
+    try:
+        with patch.object(
+            PersonaMarkdownParser, "_parse_content", wraps=PersonaMarkdownParser._parse_content
+        ) as mock_parse:
+            first = PersonaBuilder.from_markdown(temp_path)
+            first.add_constraint("Only on the first builder")
+            second = PersonaBuilder.from_markdown(temp_path)
+            assert mock_parse.call_count == 1
+
+            PersonaBuilder.clear_cache()
+            PersonaBuilder.from_markdown(temp_path)
+            assert mock_parse.call_count == 2
+
+        assert second._role == "Cached Role"
+        assert second._constraints == []
+    finally:
+        PersonaBuilder.clear_cache()
+        temp_path.unlink()
+
+
+@pytest.mark.asyncio
+async def test_from_markdown_many_preserves_order(tmp_path):
+    """from_markdown_many() loads files concurrently and returns builders in input order."""
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"persona_{index}.md"
+        path.write_text(
+            f"---\nrole: Role {index}\ngoal: Goal {index}\n---\n\n# Backstory\nBackstory {index}\n"
+        )
+        paths.append(path)
+
+    builders = await PersonaBuilder.from_markdown_many(paths)
+
+    assert [builder.name for builder in builders] == ["persona_0", "persona_1", "persona_2"]
+    assert [builder._role for builder in builders] == ["Role 0", "Role 1", "Role 2"]
+
+    with pytest.raises(FileNotFoundError):
+        await PersonaBuilder.from_markdown_many([tmp_path / "missing.md"])
+
+
+def test_read_markdown_frontmatter_skips_body(tmp_path):
+    """read_markdown_frontmatter() returns frontmatter only and handles files without it."""
+    path = tmp_path / "analyst.md"
+    path.write_text(
+        "---\nname: analyst\nrole: Data Analyst\nmetadata:\n  team: research\n---\n\n"
+        "# Backstory\n" + "Long backstory line.\n" * 1000
+    )
+
+    frontmatter = PersonaBuilder.read_markdown_frontmatter(path)
+    assert frontmatter == {
+        "name": "analyst",
+        "role": "Data Analyst",
+        "metadata": {"team": "research"},
+    }
+
+    spaced = tmp_path / "spaced.md"
+    spaced.write_text("---\nrole: Spaced\n--- \n\n# Backstory\nOne\n\n---\n\nTwo\n")
+    assert PersonaBuilder.read_markdown_frontmatter(spaced) == {"role": "Spaced"}
+
+    plain = tmp_path / "plain.md"
+    plain.write_text("# Backstory\nNo frontmatter here.\n")
+    assert PersonaBuilder.read_markdown_frontmatter(plain) == {}
+
+    with pytest.raises(FileNotFoundError, match="Persona Markdown file not found"):
+        PersonaBuilder.read_markdown_frontmatter(tmp_path / "missing.md")
+
+
+def test_build_index_skips_parsing_unchanged_files(tmp_path):
+    """Indexed files load without parsing; edited files are parsed again."""
+    from unittest.mock import patch
+
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    path = tmp_path / "indexed.md"
+    path.write_text(
+        '---\nrole: Indexed Role\ngoal: Indexed Goal\nversion: "2.0"\n---\n\n# Backstory\nFrom disk\n'
+    )
+
+    index_path = PersonaBuilder.build_index(tmp_path)
+    assert index_path.name == "personas.index.json"
+
+    PersonaBuilder.clear_cache()
+    try:
+        with patch.object(
+            PersonaMarkdownParser, "_parse_content", wraps=PersonaMarkdownParser._parse_content
+        ) as mock_parse:
+            builder = PersonaBuilder.from_markdown(path)
+            assert mock_parse.call_count == 0
+            assert builder._role == "Indexed Role"
+            assert builder._backstory == "From disk"
+            assert builder._version == "2.0"
+
+            path.write_text(
+                "---\nrole: Edited Role\ngoal: Edited Goal\n---\n\n# Backstory\nEdited\n"
+            )
+            assert PersonaBuilder.from_markdown(path)._role == "Edited Role"
+            assert mock_parse.call_count == 1
+    finally:
+        PersonaBuilder.clear_cache()
+
+
+def test_build_index_leaves_out_configs_json_would_change(tmp_path):
+    """Files whose config would not load back from JSON unchanged are not indexed."""
+    import json
+
+    (tmp_path / "plain.md").write_text("---\nrole: Role\ngoal: Goal\n---\n\n# Backstory\nPlain\n")
+    int_keys = tmp_path / "int_keys.md"
+    int_keys.write_text(
+        "---\nrole: Role\ngoal: Goal\nmetadata:\n  2024: launch\n---\n\n# Backstory\nKeys\n"
+    )
+
+    index_path = PersonaBuilder.build_index(tmp_path)
+    assert set(json.loads(index_path.read_text())) == {"plain.md"}
+
+    PersonaBuilder.clear_cache()
+    try:
+        assert PersonaBuilder.from_markdown(int_keys)._metadata == {2024: "launch"}
+    finally:
+        PersonaBuilder.clear_cache()
+
+
+def test_from_markdown_normalizes_crlf_files(tmp_path):
+    """Files with Windows line endings load the same as files with Unix ones."""
+    text = "---\nrole: Role\ngoal: Goal\nversion: '1.0'\n---\n\n# Backstory\nLine one\nLine two\n"
+    unix_path = tmp_path / "unix.md"
+    windows_path = tmp_path / "windows.md"
+    unix_path.write_bytes(text.encode("utf-8"))
+    windows_path.write_bytes(text.replace("\n", "\r\n").encode("utf-8"))
+
+    unix = PersonaBuilder.from_markdown(unix_path)
+    windows = PersonaBuilder.from_markdown(windows_path)
+    assert windows._backstory == unix._backstory == "Line one\nLine two"
+    assert windows._role == unix._role
+
+
+def test_revalidate_interval_serves_recent_parse(tmp_path, monkeypatch):
+    """Within REVALIDATE_INTERVAL edits are not seen; clear_cache() forces a fresh check."""
+    from ag2_persona.parsers import PersonaMarkdownParser
+
+    path = tmp_path / "hot.md"
+    path.write_text("---\nrole: Original\ngoal: Goal\nversion: '1.0'\n---\n\n# Backstory\nText\n")
+
+    monkeypatch.setattr(PersonaMarkdownParser, "REVALIDATE_INTERVAL", 3600.0)
+    PersonaBuilder.clear_cache()
+    try:
+        assert PersonaBuilder.from_markdown(path)._role == "Original"
+
+        path.write_text(
+            "---\nrole: Edited Role\ngoal: Goal\nversion: '1.0'\n---\n\n# Backstory\nText\n"
+        )
+        assert PersonaBuilder.from_markdown(path)._role == "Original"
+
+        PersonaBuilder.clear_cache()
+        assert PersonaBuilder.from_markdown(path)._role == "Edited Role"
+    finally:
+        PersonaBuilder.clear_cache()
+
+
+def test_frontmatter_uses_yaml_12_scalars():
+    """yes/no/on/off and 1:30 stay strings, as in YAML 1.2; true/false are booleans."""
+    builder = PersonaBuilder("scheduler").with_markdown(
+        "---\nrole: Scheduler\ngoal: No\nversion: '1.0'\nmetadata:\n"
+        "  answer: yes\n  switch: off\n  slot: 1:30\n  enabled: true\n  retries: 3\n---\n\n"
+        "# Backstory\nKeeps time.\n"
+    )
+    assert builder._goal == "No"
+    assert builder._metadata == {
+        "answer": "yes",
+        "switch": "off",
+        "slot": "1:30",
+        "enabled": True,
+        "retries": 3,
+    }
+
+
+_YAML_12_NUMBERS = {
+    "sci": ("1e3", 1000.0),
+    "sci_fraction": ("1.5e10", 1.5e10),
+    "sci_negative": ("7e-1", 0.7),
+    "sci_upper": ("1E+3", 1000.0),
+    "leading_dot": ("-.5", -0.5),
+    "leading_zero": ("0777", 777),
+    "octal": ("0o17", 15),
+    "negative_octal": ("-0o7", -7),
+    "hex": ("0x1F", 31),
+    "binary": ("0b101", 5),
+    "underscores": ("1_000", 1000),
+    "not_octal": ("08", 8),
+}
+
+
+def test_frontmatter_uses_yaml_12_numbers():
+    """Numbers follow the YAML 1.2 core schema: 1e3 is a float, 0777 decimal, 0o17 octal."""
+    from ag2_persona.parsers import _frontmatter_handler
+
+    document = "\n".join(f"{key}: {scalar}" for key, (scalar, _) in _YAML_12_NUMBERS.items())
+    loaded = _frontmatter_handler().load(document)
+
+    for key, (scalar, expected) in _YAML_12_NUMBERS.items():
+        assert loaded[key] == expected, scalar
+        assert type(loaded[key]) is type(expected), scalar
+
+
+def test_frontmatter_scalars_match_ruamel_yaml():
+    """Plain scalars resolve to the same values ruamel.yaml gives in YAML 1.2 mode."""
+    ruamel_yaml = pytest.importorskip("ruamel.yaml")
+    from ag2_persona.parsers import _frontmatter_handler
+
+    scalars = [scalar for scalar, _ in _YAML_12_NUMBERS.values()]
+    scalars += ["+.5", "1.", ".inf", ".nan", "00", "-0", "1__0", "0x", "0o8", "1e", "1:30"]
+    scalars += ["yes", "No", "off", "true", "FALSE", "012.5", "2024-01-01"]
+    document = "\n".join(f"k{index}: {scalar}" for index, scalar in enumerate(scalars))
+
+    ours = _frontmatter_handler().load(document)
+    theirs = ruamel_yaml.YAML(typ="safe", pure=True).load(document)
+    for index, scalar in enumerate(scalars):
+        key = f"k{index}"
+        assert type(ours[key]) is type(theirs[key]), scalar
+        if ours[key] == ours[key]:  # NaN never equals itself
+            assert ours[key] == theirs[key], scalar